@@ -0,0 +1,47 @@
+"""Benchmark building instances through injected `Callable[[], T]` builders.
+
+Compares building a record directly, through a builder, and with
+`Container.resolve`. Run with `PYTHONPATH=src python benchmarks/bench_builder.py`.
+"""
+
+import timeit
+from collections.abc import Callable
+
+from strappy import Container, Provider, Scope
+
+NUMBER = 100_000
+
+
+class Client: ...
+
+
+class Record:
+    def __init__(self, client: Client, row: int = 0) -> None:
+        self.client = client
+        self.row = row
+
+
+class Processor:
+    def __init__(self, make_record: Callable[..., Record]) -> None:
+        self.make_record = make_record
+
+
+def main() -> None:
+    """Print per-instance timings for each way of building records."""
+    container = Container()
+    container.add(Provider(Client, scope=Scope.SINGLETON))
+    make_record = container.resolve(Processor).make_record
+    client = container.resolve(Client)
+
+    timings = {
+        "direct": lambda: Record(client, row=1),
+        "builder": lambda: make_record(row=1),
+        "Container.resolve": lambda: container.resolve(Record, kwargs={"row": 1}),
+    }
+    for name, function in timings.items():
+        seconds = timeit.timeit(function, number=NUMBER)
+        print(f"{name:>17}  {seconds / NUMBER * 1e9:>8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
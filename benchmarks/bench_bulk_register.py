@@ -0,0 +1,76 @@
+"""Benchmark registering large plugin catalogs at start-up.
+
+Registers 1k, 10k and 100k plugin factories one `add` at a time, with
+`add_many`, and through `Container.batch`, and prints the time each takes.
+Adding one at a time copies the registry on every call, so it is only run
+up to 10k providers. Run with
+`PYTHONPATH=src python benchmarks/bench_bulk_register.py`.
+"""
+
+import time
+from collections.abc import Callable
+
+from strappy import Container, Provider
+
+SIZES = (1_000, 10_000, 100_000)
+ONE_BY_ONE_LIMIT = 10_000
+
+
+def make_factories(count: int) -> list[Callable[[], object]]:
+    """Make plugin factory functions, each annotated with its own class."""
+    factories = []
+    for index in range(count):
+        plugin = type(f"Plugin{index}", (), {})
+
+        def factory(plugin: type = plugin) -> object:
+            return plugin()
+
+        factory.__annotations__["return"] = plugin
+        factories.append(factory)
+    return factories
+
+
+def one_by_one(factories: list[Callable[[], object]]) -> None:
+    """Add providers with one `add` call each."""
+    container = Container()
+    for factory in factories:
+        container.add(Provider(factory))
+
+
+def add_many(factories: list[Callable[[], object]]) -> None:
+    """Add all providers with a single `add_many` call."""
+    Container().add_many(Provider(factory) for factory in factories)
+
+
+def batch(factories: list[Callable[[], object]]) -> None:
+    """Register all factories in a `batch` block."""
+    with Container().batch() as registrations:
+        for factory in factories:
+            registrations.register(factory)
+
+
+def timed(register: Callable[[list], None], factories: list) -> float:
+    """Get the seconds taken to register factories."""
+    start = time.perf_counter()
+    register(factories)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print registration times for each catalog size."""
+    print(f"{'providers':>9}  {'one by one':>10}  {'add_many':>10}  {'batch':>10}")
+    for size in SIZES:
+        factories = make_factories(size)
+        slow = (
+            f"{timed(one_by_one, factories):>9.3f}s"
+            if size <= ONE_BY_ONE_LIMIT
+            else f"{'-':>10}"
+        )
+        print(
+            f"{size:>9}  {slow}  {timed(add_many, factories):>9.3f}s  "
+            f"{timed(batch, factories):>9.3f}s",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Stress and throughput benchmark for resolving while registering providers.
+
+Reader threads resolve a small graph in a loop while a writer thread keeps
+registering plugin providers, and each run checks that no reader saw an
+`add` batch half applied. Run with
+`PYTHONPATH=src python benchmarks/bench_concurrent_registry.py`.
+"""
+
+import sys
+import threading
+import time
+
+from strappy import Container, Provider, RegisterMode
+
+READERS = (1, 2, 4, 8)
+DURATION = 1.0
+
+
+class Config: ...
+
+
+class Plugin: ...
+
+
+class Service:
+    def __init__(self, config: Config, plugins: list[Plugin]) -> None:
+        self.config = config
+        self.plugins = plugins
+
+
+def run(readers: int) -> tuple[float, float]:
+    """Get resolutions and registrations per second for a number of readers."""
+    container = Container()
+    container.add(Provider(Config))
+    container.add(Provider(Plugin), mode=RegisterMode.APPEND)
+    stop = threading.Event()
+    resolved = [0] * readers
+    registered = [0]
+    errors: list[BaseException] = []
+
+    def read(index: int) -> None:
+        child = container.extend()
+        try:
+            while not stop.is_set():
+                child.resolve(Service)
+                batch = registered[0]
+                if (
+                    f"a-{batch}" in child.registry
+                    and f"b-{batch}" not in child.registry
+                ):
+                    msg = f"batch {batch} was half applied"
+                    raise AssertionError(msg)  # noqa: TRY301
+                resolved[index] += 1
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    def write() -> None:
+        while not stop.is_set():
+            batch = registered[0] + 1
+            container.add(
+                Provider(instance=batch, provides=f"a-{batch}"),  # type: ignore[arg-type]
+                Provider(instance=batch, provides=f"b-{batch}"),  # type: ignore[arg-type]
+            )
+            registered[0] = batch
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return sum(resolved) / DURATION, registered[0] / DURATION
+
+
+def main() -> None:
+    """Print throughput for each number of reader threads."""
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'readers':>7}  {'resolves/s':>12}  {'registrations/s':>16}")
+    for readers in READERS:
+        resolves, registrations = run(readers)
+        print(f"{readers:>7}  {resolves:>12.0f}  {registrations:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark extending containers and resolving through deep extend() chains.
+
+The first table times a frozen chain, which is never written to. The
+second extends the deepest container once per request, registers the
+request on the new child and resolves a handler with 20 dependencies, as
+per-request containers do.
+
+Run with `PYTHONPATH=src python benchmarks/bench_extend_chain.py`.
+"""
+
+import timeit
+from dataclasses import make_dataclass
+
+from strappy import Container, Provider, Scope
+
+DEPTHS = (1, 10, 100)
+NUMBER = 100_000
+REQUESTS = 2_000
+DEPENDENCIES = 20
+
+
+class Service: ...
+
+
+class Settings: ...
+
+
+class Request:
+    def __init__(self, number: int) -> None:
+        self.number = number
+
+
+# Most of the handler's dependencies only need settings, and some need the request
+Dependencies = [
+    make_dataclass(
+        f"Dependency{index}",
+        [("request", Request)] if index % 5 == 0 else [("settings", Settings)],
+    )
+    for index in range(DEPENDENCIES)
+]
+Handler = make_dataclass(
+    "Handler",
+    [(f"dependency{index}", cls) for index, cls in enumerate(Dependencies)],
+)
+
+
+def build_chain(depth: int) -> Container:
+    """Register providers on a root container and extend it `depth` times."""
+    container = Container()
+    container.add(Provider(Service))
+    container.add(Provider(Settings, scope=Scope.SINGLETON))
+    for _ in range(depth):
+        container = container.extend()
+    return container
+
+
+def handle(leaf: Container, number: int) -> None:
+    """Resolve a handler in a new child holding the request."""
+    child = leaf.extend()
+    child.add(Provider(instance=Request(number)))
+    child.resolve(Handler)
+
+
+def main() -> None:
+    """Print per-operation timings for each chain depth."""
+    print(
+        f"{'depth':>5}  {'extend (ns)':>12}  {'lookup (ns)':>12}  {'resolve (ns)':>13}"
+    )
+    for depth in DEPTHS:
+        leaf = build_chain(depth)
+        leaf.resolve(Service)  # warm up lookups
+
+        extend = timeit.timeit(leaf.extend, number=NUMBER)
+        lookup = timeit.timeit(lambda: leaf.registry[Service], number=NUMBER)  # noqa: B023
+        resolve = timeit.timeit(lambda: leaf.resolve(Service), number=NUMBER)  # noqa: B023
+
+        print(
+            f"{depth:>5}  {extend / NUMBER * 1e9:>12.0f}  "
+            f"{lookup / NUMBER * 1e9:>12.0f}  {resolve / NUMBER * 1e9:>13.0f}",
+        )
+
+    print()
+    print(f"{'depth':>5}  {'per request (us)':>16}")
+    for depth in DEPTHS:
+        leaf = build_chain(depth)
+        handle(leaf, 0)  # warm up
+        numbers = iter(range(REQUESTS))
+        seconds = timeit.timeit(lambda: handle(leaf, next(numbers)), number=REQUESTS)  # noqa: B023
+        print(f"{depth:>5}  {seconds / REQUESTS * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark the overhead of calling handlers through `Container.inject`.
+
+Run with `PYTHONPATH=src python benchmarks/bench_inject.py`.
+"""
+
+import timeit
+
+from strappy import Container, Provider, Scope
+
+NUMBER = 100_000
+
+
+class Database: ...
+
+
+class Request: ...
+
+
+def handler(request: Request, database: Database) -> Database:
+    """Stand in for a request handler."""
+    return database
+
+
+def main() -> None:
+    """Print per-call timings for plain, injected and container calls."""
+    container = Container()
+    container.add(Provider(Database, scope=Scope.SINGLETON))
+    injected = container.inject(handler)
+    request = Request()
+    database = Database()
+
+    timings = {
+        "plain call": lambda: handler(request, database),
+        "inject, all passed": lambda: injected(request, database),
+        "inject, one resolved": lambda: injected(request),
+        "Container.call": lambda: container.call(
+            handler,
+            kwargs={"request": request},
+        ),
+    }
+    for name, function in timings.items():
+        seconds = timeit.timeit(function, number=NUMBER)
+        print(f"{name:>20}  {seconds / NUMBER * 1e9:>8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
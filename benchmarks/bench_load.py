@@ -0,0 +1,221 @@
+"""Load test resolving per-request dependency graphs under concurrency.
+
+Each simulated request extends an application container, registers the
+request on the child and resolves a handler whose graph mixes singletons,
+transient providers and `Annotated[..., Depends(...)]` parameters. Requests
+are driven from a thread pool and from asyncio tasks awaiting `aresolve`,
+and throughput and latency percentiles are reported for each concurrency
+level.
+
+Run with `PYTHONPATH=src python benchmarks/bench_load.py`, and see `--help`
+for the options. Requires FastAPI, which is a development dependency.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+from fastapi import Depends
+
+from strappy import Container, Provider, Scope
+
+
+class Settings:
+    def __init__(self) -> None:
+        self.page_size = 50
+
+
+class Pool:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Cache: ...
+
+
+class Request:
+    def __init__(self, number: int) -> None:
+        self.number = number
+
+
+class Session:
+    def __init__(self, pool: Pool, request: Request) -> None:
+        self.pool = pool
+        self.request = request
+
+
+def get_page_size(settings: Settings) -> int:
+    """Read the page size from the settings."""
+    return settings.page_size
+
+
+class Repository:
+    def __init__(
+        self,
+        session: Session,
+        cache: Cache,
+        page_size: Annotated[int, Depends(get_page_size)],
+    ) -> None:
+        self.session = session
+        self.cache = cache
+        self.page_size = page_size
+
+
+class Auditor:
+    def __init__(self, session: Session, request: Request) -> None:
+        self.session = session
+        self.request = request
+
+
+class Handler:
+    def __init__(self, repository: Repository, auditor: Auditor) -> None:
+        self.repository = repository
+        self.auditor = auditor
+
+
+def build_app() -> Container:
+    """Build the application container shared by all requests."""
+    container = Container()
+    container.add(Provider(Settings, scope=Scope.SINGLETON))
+    container.add(Provider(Pool, scope=Scope.SINGLETON))
+    container.add(Provider(Cache, scope=Scope.SINGLETON))
+    container.add(Provider(Session, scope=Scope.RESOLUTION))
+    return container
+
+
+def check(handler: Handler, number: int) -> None:
+    """Make sure that a handler was resolved for its own request."""
+    if handler.auditor.request.number != number:
+        msg = "request leaked between containers"
+        raise AssertionError(msg)
+
+
+def handle(app: Container, number: int) -> float:
+    """Resolve the handler for one request and get the latency in seconds."""
+    start = time.perf_counter()
+    child = app.extend()
+    child.add(Provider(instance=Request(number)))
+    handler = child.resolve(Handler)
+    elapsed = time.perf_counter() - start
+    check(handler, number)
+    return elapsed
+
+
+async def ahandle(app: Container, number: int) -> float:
+    """Resolve the handler for one request with `aresolve` and get the latency."""
+    start = time.perf_counter()
+    child = app.extend()
+    child.add(Provider(instance=Request(number)))
+    handler = await child.aresolve(Handler)
+    elapsed = time.perf_counter() - start
+    check(handler, number)
+    return elapsed
+
+
+def run_threads(app: Container, concurrency: int, requests: int) -> list[float]:
+    """Handle requests on a pool of worker threads."""
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(handle, [app] * requests, range(requests)))
+
+
+def run_asyncio(app: Container, concurrency: int, requests: int) -> list[float]:
+    """Handle requests from asyncio tasks, at most `concurrency` at a time.
+
+    Tasks resolve on the loop's default executor, which is given one worker
+    per concurrent task, so that resolutions of different tasks overlap.
+    """
+
+    async def main() -> list[float]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(number: int) -> float:
+            async with semaphore:
+                return await ahandle(app, number)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            asyncio.get_running_loop().set_default_executor(executor)
+            return await asyncio.gather(*(one(number) for number in range(requests)))
+
+    return asyncio.run(main())
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Get a percentile of sorted samples by the nearest rank."""
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(
+    mode: str,
+    concurrency: int,
+    requests: int,
+    run: Callable[[Container, int, int], list[float]],
+) -> float:
+    """Run one load level, print its throughput and latencies and get its p99."""
+    app = build_app()
+    run(app, concurrency, min(requests, 1000))  # warm up
+    start = time.perf_counter()
+    latencies = sorted(run(app, concurrency, requests))
+    seconds = time.perf_counter() - start
+    micros = [latency * 1e6 for latency in latencies]
+    p99 = percentile(micros, 0.99)
+    print(
+        f"{mode:>8}  {concurrency:>11}  {requests / seconds:>10.0f}  "
+        f"{statistics.median(micros):>8.0f}  {p99:>8.0f}  "
+        f"{percentile(micros, 0.999):>9.0f}",
+    )
+    return p99
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the load test for each mode and concurrency level.
+
+    Exits with status 1 if `--max-p99` is given and any level exceeds it.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--mode",
+        choices=("threads", "asyncio", "both"),
+        default="both",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16, 64],
+        help="number of concurrent workers or tasks to try",
+    )
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument(
+        "--max-p99",
+        type=float,
+        help="p99 latency budget in microseconds, to fail on regressions",
+    )
+    args = parser.parse_args(argv)
+
+    runs = {"threads": run_threads, "asyncio": run_asyncio}
+    modes = list(runs) if args.mode == "both" else [args.mode]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(
+        f"{'mode':>8}  {'concurrency':>11}  {'req/s':>10}  "
+        f"{'p50 (us)':>8}  {'p99 (us)':>8}  {'p999 (us)':>9}",
+    )
+    worst = max(
+        report(mode, concurrency, args.requests, runs[mode])
+        for mode in modes
+        for concurrency in args.concurrency
+    )
+    if args.max_p99 is not None and worst > args.max_p99:
+        print(f"p99 of {worst:.0f}us exceeds the budget of {args.max_p99:.0f}us")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
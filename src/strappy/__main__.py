@@ -0,0 +1,5 @@
+"""Entry point for `python -m strappy`."""
+
+from strappy.cli import main
+
+raise SystemExit(main())
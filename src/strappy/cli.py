@@ -0,0 +1,59 @@
+"""Command line interface for inspecting containers."""
+
+import argparse
+import sys
+from collections.abc import Sequence
+
+from strappy.container import Container
+from strappy.graph import build_graph
+from strappy.type_utils import load
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m strappy",
+        description="Inspect the dependency graphs of strappy containers.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    graph = commands.add_parser(
+        "graph",
+        help="print the dependency graph of some root types",
+        description=(
+            "Print the providers needed to resolve some root types, annotated "
+            "with their scope and the strategy that chose them."
+        ),
+    )
+    graph.add_argument("container", help="container to use, as module:attribute")
+    graph.add_argument("roots", nargs="+", help="types to resolve, as module:attribute")
+    graph.add_argument("--format", choices=("dot", "json"), default="dot")
+    graph.add_argument(
+        "--timed",
+        action="store_true",
+        help="also resolve the roots and record construction and introspection times",
+    )
+    graph.add_argument(
+        "--output",
+        "-o",
+        type=argparse.FileType("w"),
+        default=sys.stdout,
+        help="file to write to instead of standard output",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    container = load(args.container)
+    if not isinstance(container, Container):
+        parser.error(f"{args.container} is not a strappy container")
+    roots = [load(root) for root in args.roots]
+
+    graph = build_graph(container, roots, timed=args.timed)
+    args.output.write(
+        graph.to_dot() if args.format == "dot" else graph.to_json() + "\n"
+    )
+    return 0
@@ -1,16 +1,40 @@
 """Container for dependency injection."""
 
+import asyncio
 import inspect
-from collections.abc import Callable, Hashable, Mapping, Sequence
+import sys
+import threading
+import time
+from collections import ChainMap
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Executor
+from contextlib import contextmanager, suppress
+from contextvars import copy_context
 from enum import Enum
+from functools import lru_cache, partial, wraps
 from typing import Any, TypeAlias, overload
 
 from typing_extensions import Self
 
+from strappy import dependencies, introspection, resolution
 from strappy import strategies as st
-from strappy.errors import RegistrationConflictError, ResolutionError
+from strappy.errors import (
+    RegistrationConflictError,
+    ResolutionError,
+)
+from strappy.keyed import EvictionCallback, KeyedChildren
+from strappy.metrics import Metrics, ProviderStats
 from strappy.provider import Provider, Scope
-from strappy.types import ContainerLike, FactoryT, T
+from strappy.registry import MISSING, Family, Layer, RegistryView
+from strappy.selection import SelectionPolicy
+from strappy.types import CallableT, ContainerLike, FactoryT, T
 
 Decorator: TypeAlias = Callable[[FactoryT], FactoryT]
 Strategy: TypeAlias = Callable[[inspect.Parameter, ContainerLike], Provider | None]
@@ -28,6 +52,176 @@ class _Empty: ...
 
 
 _EMPTY = _Empty()
+_KEYED_LOCK = threading.Lock()
+_SHARED_SCOPES = (Scope.SINGLETON, Scope.WEAK_SINGLETON, Scope.THREAD, Scope.TASK)
+_VARIADIC = (
+    inspect._ParameterKind.VAR_POSITIONAL,  # noqa: SLF001
+    inspect._ParameterKind.VAR_KEYWORD,  # noqa: SLF001
+)
+
+
+@lru_cache(maxsize=1024)
+def _service_param(service: Hashable) -> inspect.Parameter:
+    return inspect.Parameter(  # name and kind are arbitrary
+        name="_",
+        kind=inspect._ParameterKind.POSITIONAL_ONLY,  # noqa: SLF001
+        annotation=service,
+    )
+
+
+class _Plan:
+    """Provider chosen by the strategies for a parameter, and the keys it used.
+
+    Shared results are built by the container owning the provider, and
+    others by the container resolving the parameter. A plan was last
+    checked at a family generation and epoch, and a stamp of the planning
+    container's own changes.
+    """
+
+    __slots__ = (
+        "chosen_by",
+        "epoch",
+        "generation",
+        "keys",
+        "owner",
+        "provider",
+        "stamp",
+        "strategies",
+    )
+
+    def __init__(
+        self,
+        provider: Provider | None,
+        keys: frozenset[Hashable],
+        generation: int,
+        strategies: tuple[Strategy, ...],
+        *,
+        chosen_by: Strategy | None = None,
+        owner: "Container | None" = None,
+        epoch: int = 0,
+        stamp: int = 0,
+    ) -> None:
+        self.provider = provider
+        self.owner = owner
+        self.chosen_by = chosen_by
+        self.keys = keys
+        self.generation = generation
+        self.epoch = epoch
+        self.stamp = stamp
+        self.strategies = strategies
+
+
+class _Injected:
+    """Parameter of an injected function, and where callers may pass it."""
+
+    __slots__ = ("name", "param", "position", "positional")
+
+    def __init__(
+        self,
+        position: int,
+        name: str,
+        param: inspect.Parameter,
+        *,
+        positional: bool,
+    ) -> None:
+        self.position = position
+        self.name = name
+        self.param = param
+        self.positional = positional
+
+
+def _injected_params(params: Mapping[str, inspect.Parameter]) -> list[_Injected]:
+    injected = []
+    for position, (name, param) in enumerate(params.items()):
+        if name in {"self", "cls"} or param.kind in _VARIADIC:
+            continue
+        keyword_only = param.kind == inspect._ParameterKind.KEYWORD_ONLY  # noqa: SLF001
+        injected.append(
+            _Injected(
+                sys.maxsize if keyword_only else position,
+                name,
+                param,
+                positional=param.kind == inspect._ParameterKind.POSITIONAL_ONLY,  # noqa: SLF001
+            ),
+        )
+    return injected
+
+
+def _register(
+    add: Callable[[Provider], object],
+    factory: FactoryT | None,
+    *,
+    provides: type | None,
+    kwargs: dict[str, Any] | None,
+    scope: Scope | None,
+) -> FactoryT | Decorator:
+    # Case 1: Decorator without arguments, i.e. @register
+    if factory is not None:
+        add(Provider(factory=factory))
+        return factory
+
+    # Case 2: Decorator with arguments, i.e. @register(...)
+    def decorator(factory_: FactoryT) -> FactoryT:
+        add(
+            Provider(
+                factory=factory_,  # type: ignore[reportArgumentType]
+                kwargs=kwargs,
+                scope=scope,
+                provides=provides,
+            ),
+        )
+        return factory_
+
+    return decorator
+
+
+class Registrations:
+    """Providers collected by `Container.batch` to be added together."""
+
+    def __init__(self) -> None:
+        """Start without providers."""
+        self.providers: list[Provider] = []
+
+    def add(self, *providers: Provider) -> None:
+        """Add providers to the batch."""
+        self.providers.extend(providers)
+
+    @overload
+    def register(
+        self,
+        factory: FactoryT,
+        *,
+        provides: None = None,
+        kwargs: None = None,
+        scope: None = None,
+    ) -> FactoryT: ...
+
+    @overload
+    def register(
+        self,
+        factory: None = None,
+        *,
+        provides: type | None = None,
+        kwargs: dict[str, Any] | None = None,
+        scope: Scope | None = None,
+    ) -> Decorator: ...
+
+    def register(
+        self,
+        factory: FactoryT | None = None,
+        *,
+        provides: type | None = None,
+        kwargs: dict[str, Any] | None = None,
+        scope: Scope | None = None,
+    ) -> FactoryT | Decorator:
+        """Add a factory to the batch, like `Container.register`."""
+        return _register(
+            self.providers.append,
+            factory,
+            provides=provides,
+            kwargs=kwargs,
+            scope=scope,
+        )
 
 
 class Container:
@@ -39,39 +233,99 @@ class Container:
             st.use_depends_meta_if_present,
             st.search_registry_for_type,
             st.search_registry_for_collection_inner_type,
+            st.use_builder_for_callable,
             st.use_type_as_factory,
         ),
         parent: Self | None = None,
+        *,
+        collect_stats: bool = False,
     ) -> None:
-        """Create a new  container for dependency injection."""
+        """Create a new  container for dependency injection.
+
+        With `collect_stats`, the container and all containers extending it
+        count what their providers build; see `stats`.
+        """
         self.strategies = strategies or []
         self.parent = parent
 
         self._registry: dict[Hashable, list[Provider]] = {}
+        self._overrides: dict[Hashable, list[Provider]] = {}
+        self._write_lock = threading.Lock()
+        self._stamp = 0
+        self._extended = False
+        self._family = parent._family if parent else Family()  # noqa: SLF001
+        if parent is not None and not parent._extended:  # noqa: SLF001
+            with parent._write_lock:  # noqa: SLF001
+                parent._extended = True  # noqa: SLF001
+        if collect_stats and self._family.metrics is None:
+            self._family.metrics = Metrics()
+        self._layer: Layer | None = None
+        self._plans: dict[inspect.Parameter, _Plan] = {}
+        self._dispatch: dict[Hashable, tuple[Strategy, ...]] = {}
+        self._dispatch_for: Sequence[Strategy] = self.strategies
+        self._keyed: KeyedChildren[Self] | None = None
+        self._selection: dict[Hashable, SelectionPolicy | None] = {}
+
+    def _publish(
+        self,
+        registry: dict[Hashable, list[Provider]],
+        keys: Iterable[Hashable],
+    ) -> None:
+        # Registries are copied on write and published with a single
+        # assignment, so readers never lock and never see a partial update.
+        self._registry = registry
+        self._changed(keys)
+
+    def _own(self) -> Mapping[Hashable, list[Provider]]:
+        # Overrides are published as a small overlay on top of the registry,
+        # so entering and leaving `override` does not copy the registry.
+        overrides = self._overrides
+        if not overrides:
+            return self._registry
+        return ChainMap(overrides, self._registry)
+
+    def _changed(self, keys: Iterable[Hashable]) -> None:
+        # Changes to a container that was never extended only affect its own
+        # view, so they leave the layers and plans of other containers valid.
+        self._stamp = self._family.bump(keys, shared=self._extended)
 
     def unset(self, key: Hashable) -> None:
         """Clear all registrations for the given type."""
-        self._registry.pop(key, None)
+        with self._write_lock:
+            registry = dict(self._registry)
+            registry.pop(key, None)
+            self._publish(registry, (key,))
 
     def clear(self, key: Hashable) -> None:
         """Clear all registrations for the given type."""
-        self._registry[key] = []
+        with self._write_lock:
+            self._publish({**self._registry, key: []}, (key,))
 
-    def _add_one(
-        self,
-        provider: Provider,
-        mode: RegisterMode = RegisterMode.RAISE_ON_CONFLICT,
+    @staticmethod
+    def _add_all(
+        registry: dict[Hashable, list[Provider]],
+        providers: Sequence[Provider],
+        mode: RegisterMode,
     ) -> None:
-        """Add a provider to the container registry."""
-        if (
-            mode == RegisterMode.RAISE_ON_CONFLICT
-            and provider.provides in self._registry
-        ):
-            raise RegistrationConflictError(str(provider.provides))
-        if mode == RegisterMode.OVERWRITE:
-            self.clear(provider.provides)
-        self._registry.setdefault(provider.provides, [])
-        self._registry[provider.provides].append(provider)
+        # Each key's list is copied once per batch and then appended to in
+        # place, so a batch takes time linear in its size.
+        touched: dict[Hashable, list[Provider]] = {}
+        for provider in providers:
+            key = provider.provides
+            registered = touched.get(key)
+            if registered is None:
+                if mode == RegisterMode.RAISE_ON_CONFLICT and key in registry:
+                    raise RegistrationConflictError(str(key))
+                registered = (
+                    [] if mode == RegisterMode.OVERWRITE else [*registry.get(key, ())]
+                )
+                touched[key] = registered
+            elif mode == RegisterMode.RAISE_ON_CONFLICT:
+                raise RegistrationConflictError(str(key))
+            elif mode == RegisterMode.OVERWRITE:
+                registered.clear()
+            registered.append(provider)
+        registry.update(touched)
 
     def add(
         self,
@@ -79,22 +333,60 @@ class Container:
         mode: RegisterMode = RegisterMode.RAISE_ON_CONFLICT,
     ) -> None:
         """Add a provider to the container registry."""
-        if mode == RegisterMode.RAISE_ON_CONFLICT:
-            seen = set(self._registry)
-            for provider in providers:
-                if provider.provides in seen:
-                    raise RegistrationConflictError(str(provider.provides))
-                seen.add(provider.provides)
+        self.add_many(providers, mode=mode)
 
-        for provider in providers:
-            self._add_one(provider, mode=mode)
+    def add_many(
+        self,
+        providers: Iterable[Provider],
+        mode: RegisterMode = RegisterMode.RAISE_ON_CONFLICT,
+    ) -> None:
+        """Add providers to the container registry in one batch.
+
+        The registry is copied and published once for the whole batch, so
+        adding many providers at once is much faster than adding them one by
+        one. If any of them conflicts, none of them are added.
+        """
+        providers = list(providers)
+        with self._write_lock:
+            registry = dict(self._registry)
+            self._add_all(registry, providers, mode)
+            self._publish(registry, {provider.provides for provider in providers})
+
+    @contextmanager
+    def batch(
+        self,
+        mode: RegisterMode = RegisterMode.RAISE_ON_CONFLICT,
+    ) -> Iterator["Registrations"]:
+        """Collect registrations and add them in one batch when the block exits.
+
+        Nothing is added if the block raises.
+        """
+        registrations = Registrations()
+        yield registrations
+        self.add_many(registrations.providers, mode=mode)
+
+    def _current_layer(self) -> Layer:
+        # Layers are rebuilt lazily, after changes to the container or to an
+        # ancestor, so extending is O(1) and lookups are memoized however
+        # deep the chain is. The epoch and stamp are read before the
+        # registry, so a layer is never stamped newer than its contents.
+        layer = self._layer
+        epoch = self._family.epoch
+        stamp = self._stamp
+        if layer is None or layer.epoch != epoch or layer.stamp != stamp:
+            parent_layer = self.parent._current_layer() if self.parent else None  # noqa: SLF001
+            layer = Layer(self._own(), parent_layer, epoch, stamp)
+            self._layer = layer
+        return layer
 
     @property
-    def registry(self) -> dict[Hashable, list[Provider]]:
-        """Get the combined registry from this container and its ancestors."""
-        if self.parent:
-            return {**self.parent.registry, **self._registry}
-        return {**self._registry}
+    def registry(self) -> Mapping[Hashable, list[Provider]]:
+        """Get a read-only snapshot of this container's and its ancestors' registry.
+
+        The snapshot does not change when providers are registered later, so
+        strategies should read `registry` once per lookup of a parameter.
+        """
+        return RegistryView(self._current_layer())
 
     @overload
     def register(
@@ -128,25 +420,195 @@ class Container:
         mode: RegisterMode = RegisterMode.RAISE_ON_CONFLICT,
     ) -> FactoryT | Decorator:
         """Inject a factory into this container."""
-        # Case 1: Decorator without arguments, i.e. @register
-        if factory is not None:
-            self.add(Provider(factory=factory))
-            return factory
-
-        # Case 2: Decorator with arguments, i.e. @register(...)
-        def decorator(factory_: FactoryT) -> FactoryT:
-            self.add(
-                Provider(
-                    factory=factory_,  # type: ignore[reportArgumentType]
-                    kwargs=kwargs,
-                    scope=scope,
-                    provides=provides,
-                ),
-                mode=mode,
-            )
-            return factory_
+        return _register(
+            partial(self.add, mode=mode),
+            factory,
+            provides=provides,
+            kwargs=kwargs,
+            scope=scope,
+        )
+
+    @contextmanager
+    def override(self, overrides: Mapping[Hashable, Any]) -> Iterator[Self]:
+        """Temporarily replace the registrations for some keys.
+
+        Values may be providers or instances. Only cached singletons built
+        from the overridden keys are dropped, and everything is restored
+        exactly when the block exits. Overrides are published as an overlay
+        on the registry, so this takes time in the number of overridden
+        keys rather than in the size of the registry.
+        """
+        replacements = {
+            key: value
+            if isinstance(value, Provider)
+            else Provider(instance=value, provides=key)  # type: ignore[reportArgumentType]
+            for key, value in overrides.items()
+        }
+        with self._write_lock:
+            previous: dict[Hashable, Any] = {
+                key: self._overrides.get(key, MISSING) for key in replacements
+            }
+            registered: dict[Hashable, Any] = {
+                key: self._registry.get(key, MISSING) for key in replacements
+            }
+            self._overrides = {
+                **self._overrides,
+                **{key: [provider] for key, provider in replacements.items()},
+            }
+            self._changed(replacements)
+        stale = {
+            provider: provider._cache_state()  # noqa: SLF001
+            for provider in self._family.dependents(replacements)
+        }
+        for provider in stale:
+            provider.reset()
+        try:
+            yield self
+        finally:
+            with self._write_lock:
+                overrides = dict(self._overrides)
+                for key, providers in previous.items():
+                    if providers is MISSING:
+                        overrides.pop(key, None)
+                    else:
+                        overrides[key] = providers
+                self._overrides = overrides
+                # Registrations for overridden keys made within the block are
+                # dropped, which is the only case that copies the registry.
+                if any(
+                    self._registry.get(key, MISSING) is not providers
+                    for key, providers in registered.items()
+                ):
+                    registry = dict(self._registry)
+                    for key, providers in registered.items():
+                        if providers is MISSING:
+                            registry.pop(key, None)
+                        else:
+                            registry[key] = providers
+                    self._registry = registry
+                self._changed(replacements)
+            for provider in self._family.dependents(replacements):
+                provider.reset()
+            for provider, state in stale.items():
+                provider._restore_cache_state(state)  # noqa: SLF001
 
-        return decorator
+    def _strategies_for(self, param: inspect.Parameter) -> tuple[Strategy, ...]:
+        # Strategies are grouped by the parameter shapes they declare, so each
+        # shape only runs the strategies that can apply to it.
+        shape = st.get_shape(param)
+        try:
+            return self._dispatch[shape]
+        except KeyError:
+            pass
+        origin, metadata_types, default_type = shape
+        strategies = self._dispatch[shape] = tuple(
+            strategy
+            for strategy in self.strategies
+            if (shapes := getattr(strategy, "applies_to", None)) is None
+            or shapes.match(origin, metadata_types, default_type)
+        )
+        return strategies
+
+    def _plan(self, param: inspect.Parameter) -> _Plan:
+        # Plans are reused until one of the keys they looked up is changed,
+        # and children reuse their parent's plans unless they shadow one of
+        # those keys, so a new child only plans what it registered itself.
+        if self._dispatch_for is not self.strategies:
+            self._plans = {}
+            self._dispatch = {}
+            self._dispatch_for = self.strategies
+        family = self._family
+        epoch = family.epoch
+        stamp = self._stamp
+        generation = family.generation
+        try:
+            plan = self._plans.get(param)
+        except TypeError:  # unhashable default value
+            plan = None
+        if plan is not None:
+            if plan.epoch == epoch and plan.stamp == stamp:
+                return plan
+            if family.unchanged_since(plan.keys, plan.generation):
+                plan.epoch = epoch
+                plan.stamp = stamp
+                plan.generation = generation
+                return plan
+            self._plans.pop(param, None)
+        plan = self._inherited_plan(param)
+        if plan is None:
+            plan = self._new_plan(param)
+        plan.generation = generation
+        plan.epoch = epoch
+        plan.stamp = stamp
+        with suppress(TypeError):  # unhashable default value
+            self._plans[param] = plan
+        return plan
+
+    def _inherited_plan(self, param: inspect.Parameter) -> _Plan | None:
+        # Copied so that the copy can be checked against this container's
+        # own stamp, while the keys it depends on stay the same.
+        parent = self.parent
+        if parent is None or parent.strategies is not self.strategies:
+            return None
+        inherited = parent._plan(param)  # noqa: SLF001
+        if self._shadows(inherited.keys):
+            return None
+        return _Plan(
+            inherited.provider,
+            inherited.keys,
+            inherited.generation,
+            inherited.strategies,
+            chosen_by=inherited.chosen_by,
+            owner=inherited.owner,
+        )
+
+    def _new_plan(self, param: inspect.Parameter) -> _Plan:
+        strategies = self._strategies_for(param)
+        provider = chosen_by = owner = None
+        with dependencies.collect() as keys:
+            for strategy in strategies:
+                provider = strategy(param, self)
+                if provider is not None:
+                    chosen_by = strategy
+                    owner = self._owner_of(provider)
+                    break
+        return _Plan(
+            provider,
+            frozenset(keys),
+            0,
+            strategies,
+            chosen_by=chosen_by,
+            owner=owner,
+        )
+
+    def _shadows(self, keys: frozenset[Hashable]) -> bool:
+        # Whether this container's own registrations or selection policies
+        # change any of the lookups that a parent's plan made.
+        registry = self._own()
+        selection = self._selection
+        if not registry and not selection:
+            return False
+        if dependencies.ANY_KEY in keys:
+            return True
+        return not (
+            registry.keys().isdisjoint(keys) and selection.keys().isdisjoint(keys)
+        )
+
+    def _owner_of(self, provider: Provider) -> Self | None:
+        # Shared results are built by the nearest container that registered
+        # the provider, so that registrations in a child never leak into
+        # results that its parent and siblings also see. Other results are
+        # built by whichever container needs them.
+        if provider.scope not in _SHARED_SCOPES or provider.instance is not None:
+            return None
+        dependencies.record(provider.provides)
+        container: Self | None = self
+        while container is not None:
+            registered = container._own().get(provider.provides, ())  # noqa: SLF001
+            if any(candidate is provider for candidate in registered):
+                return container
+            container = container.parent
+        return self
 
     def _resolve_param(
         self,
@@ -154,60 +616,261 @@ class Container:
         args: tuple = (),  # noqa: ARG002
         kwargs: dict[str, Any] | None = None,
     ) -> Any:
-        providers = [
-            result
-            for strategy in self.strategies
-            if (result := strategy(param, self)) is not None
-        ]
-        if providers:
-            return providers[0].get(self, kwargs=kwargs)
-        return _EMPTY
+        plan = self._plan(param)
+        dependencies.record_all(plan.keys)
+        provider = plan.provider
+        if provider is None:
+            return _EMPTY
+        return self._provide(provider, plan.owner or self, kwargs)
+
+    def provide(
+        self,
+        provider: Provider[T],
+        kwargs: dict[str, Any] | None = None,
+    ) -> T:
+        """Get a result from a provider found in this container's registry.
+
+        Shared results are built by the container owning the provider, and
+        indexed under the keys they were built from, like the results of
+        providers chosen by the strategies.
+        """
+        return self._provide(provider, self._owner_of(provider) or self, kwargs)
+
+    def _provide(
+        self,
+        provider: Provider[T],
+        owner: "Container",
+        kwargs: dict[str, Any] | None,
+    ) -> T:
+        result = provider.get(owner, kwargs=kwargs)
+        if provider.scope in _SHARED_SCOPES:
+            self._family.index_singleton(provider)
+        return result
+
+    def _resolve_argument(
+        self,
+        function: Callable,
+        param: inspect.Parameter,
+    ) -> Any:
+        active = resolution.current()
+        try:
+            if active is None or active.deadline is None:
+                resolved = self._resolve_param(param)
+            else:
+                # Tracked so that waiting callers can tell what ran out of time
+                with active.needing(function, param.name):
+                    resolved = self._resolve_param(param)
+        except ResolutionError as exc:
+            exc.add_frame(function, param.name)
+            raise
+        if (
+            resolved is _EMPTY
+            and param.default is inspect._empty  # noqa: SLF001
+            and param.kind not in _VARIADIC
+        ):
+            missing = ResolutionError(
+                param.annotation,
+                strategies=self._plan(param).strategies,
+            )
+            if self._family.metrics is not None:
+                self._family.metrics.record_failure(param.annotation)
+            raise missing.add_frame(function, param.name)
+        return resolved
 
     def resolve(
         self,
         service: type[T],
         args: tuple = (),
         kwargs: dict[str, Any] | None = None,
+        *,
+        executor: Executor | None = None,
+        deadline: float | None = None,
     ) -> T:
-        """Get an instance from the container's registered providers."""
-        result = self._resolve_param(
-            inspect.Parameter(  # name and kind are arbitrary
-                name="_",
-                kind=inspect._ParameterKind.POSITIONAL_ONLY,  # noqa: SLF001
-                annotation=service,
-            ),
-            args=args,
-            kwargs=kwargs,
-        )
+        """Get an instance from the container's registered providers.
+
+        With an executor, independent dependencies are built concurrently.
+        With a `deadline`, a `time.monotonic()` time, builds that have not
+        finished by then raise `DeadlineExceededError`; see `Provider`.
+        """
+        with resolution.begin(executor, self._family.metrics, deadline):
+            result = self._resolve_param(
+                _service_param(service),
+                args=args,
+                kwargs=kwargs,
+            )
         if result is not _EMPTY:
             return result
-        raise ResolutionError
+        if self._family.metrics is not None:
+            self._family.metrics.record_failure(service)
+        raise ResolutionError(
+            service,
+            strategies=self._plan(_service_param(service)).strategies,
+        )
+
+    def has_provider(self, service: Any) -> bool:
+        """Check whether a provider would be chosen for a type.
+
+        The answer depends on the keys that the type's lookup depends on,
+        which are recorded for whatever is being planned.
+        """
+        plan = self._plan(_service_param(service))
+        dependencies.record_all(plan.keys)
+        return plan.provider is not None
+
+    def builder(self, service: type[T]) -> Callable[..., T]:
+        """Get a function building an instance of a type each time it is called.
+
+        The provider for the type is chosen once, and chosen again only after
+        a registration it depends on has changed, so each call costs little
+        more than building the instance. Keyword arguments are passed on to
+        the type's factory.
+        """
+        param = _service_param(service)
+        family = self._family
+        plan = self._plan(param)
+
+        def build(**kwargs: Any) -> T:
+            nonlocal plan
+            if not family.unchanged_since(plan.keys, plan.generation):
+                plan = self._plan(param)
+            provider = plan.provider
+            if provider is None:
+                if family.metrics is not None:
+                    family.metrics.record_failure(service)
+                raise ResolutionError(service, strategies=plan.strategies)
+            with resolution.begin(None, family.metrics):
+                return self._provide(provider, plan.owner or self, kwargs)
+
+        return build
+
+    async def aresolve(
+        self,
+        service: type[T],
+        args: tuple = (),
+        kwargs: dict[str, Any] | None = None,
+        *,
+        executor: Executor | None = None,
+        deadline: float | None = None,
+    ) -> T:
+        """Get an instance without blocking the event loop.
+
+        The instance is resolved on the loop's default executor, like
+        `resolve`, on behalf of the calling task, which owns any results
+        with `Scope.TASK`. With a `deadline`, waiting stops at the deadline
+        even if a build cannot be abandoned, and `DeadlineExceededError` is
+        raised.
+        """
+        loop = asyncio.get_running_loop()
+        prepared = resolution.Resolution(executor, self._family.metrics, deadline)
+        resolving = loop.run_in_executor(
+            None,
+            copy_context().run,
+            partial(self._resolve_prepared, prepared, service, args, kwargs),
+        )
+        if deadline is None:
+            return await resolving
+        try:
+            return await asyncio.wait_for(
+                resolving,
+                timeout=max(deadline - time.monotonic(), 0),
+            )
+        except asyncio.TimeoutError:
+            error = prepared.overdue(service)
+            if self._family.metrics is not None:
+                self._family.metrics.record_failure(error.key)
+            raise error from None
+
+    def _resolve_prepared(
+        self,
+        prepared: resolution.Resolution,
+        service: type[T],
+        args: tuple,
+        kwargs: dict[str, Any] | None,
+    ) -> T:
+        with resolution.begin(prepared=prepared):
+            return self.resolve(service, args, kwargs)
+
+    def resolve_many(
+        self,
+        services: Iterable[type],
+        *,
+        executor: Executor | None = None,
+        deadline: float | None = None,
+    ) -> list[Any]:
+        """Get instances for several types within a single shared resolution.
+
+        Providers with `Scope.RESOLUTION` are built at most once for the whole
+        batch, and each signature is only inspected once. With an executor,
+        the types and their independent dependencies are built concurrently.
+        """
+        with resolution.begin(executor, self._family.metrics, deadline) as active:
+            return active.gather(
+                [partial(self.resolve, service) for service in services],
+            )
 
     @staticmethod
     def _get_params(f: Callable | type) -> Mapping[str, inspect.Parameter]:
+        return introspection.get_params(f)
+
+    def _get_params_once(
+        self,
+        f: Callable | type,
+        active: resolution.Resolution,
+    ) -> Mapping[str, inspect.Parameter]:
         try:
-            sig = inspect.signature(f)
-        except ValueError:
-            sig = inspect.signature(f.__init__)
-        return sig.parameters
+            return active.params[f]
+        except KeyError:
+            params = active.params[f] = self._get_params(f)
+            return params
+        except TypeError:  # unhashable callable
+            return self._get_params(f)
 
     def call(
         self,
         function: Callable[..., T] | type[T],
         *,
         kwargs: dict[str, Any] | None = None,
+        executor: Executor | None = None,
+        deadline: float | None = None,
+    ) -> T:
+        """Call a callable within the container's context.
+
+        With an executor, independent dependencies are built concurrently.
+        """
+        with resolution.begin(executor, self._family.metrics, deadline) as active:
+            return self._call(function, active, kwargs=kwargs)
+
+    def _call(
+        self,
+        function: Callable[..., T] | type[T],
+        active: resolution.Resolution,
+        *,
+        kwargs: dict[str, Any] | None = None,
     ) -> T:
-        """Call a callable within the container's context."""
         provided_kwargs = kwargs or {}
         bound_args = {"self", "cls"}
         skip = bound_args.union(provided_kwargs)
-        params = self._get_params(function)
-        resolved_kwargs = {
-            key: resolved
-            for key, param in params.items()
-            if key not in skip
-            and (resolved := self._resolve_param(param)) is not _EMPTY
-        }
+        params = self._get_params_once(function, active)
+        if active.executor is None:
+            resolved_kwargs = {
+                key: resolved
+                for key, param in params.items()
+                if key not in skip
+                and (resolved := self._resolve_argument(function, param)) is not _EMPTY
+            }
+        else:
+            needed = [key for key in params if key not in skip]
+            resolved = active.gather(
+                [
+                    partial(self._resolve_argument, function, params[key])
+                    for key in needed
+                ],
+            )
+            resolved_kwargs = {
+                key: value
+                for key, value in zip(needed, resolved, strict=True)
+                if value is not _EMPTY
+            }
         build_kwargs = {**resolved_kwargs, **provided_kwargs}
         positional_args = tuple(
             build_kwargs.pop(name)
@@ -217,6 +880,161 @@ class Container:
         )
         return function(*positional_args, **build_kwargs)
 
+    def inject(self, function: CallableT) -> CallableT:
+        """Wrap a function so that arguments the caller omits are resolved.
+
+        The signature is inspected once, when decorating. Each call only
+        resolves the parameters that were not passed, using plans that are
+        reused until the registrations they depend on change. Coroutine
+        functions are resolved before being awaited.
+        """
+        injected = _injected_params(self._get_params(function))
+
+        if inspect.iscoroutinefunction(function):
+
+            @wraps(function)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                args = self._resolve_missing(function, injected, args, kwargs)
+                return await function(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            args = self._resolve_missing(function, injected, args, kwargs)
+            return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    def _resolve_missing(
+        self,
+        function: Callable,
+        injected: Sequence[_Injected],
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> tuple:
+        # Adds resolved keyword arguments to `kwargs` and returns the args.
+        # Positional-only parameters left to their defaults are only passed,
+        # by their defaults, when a later one is resolved, to keep its slot.
+        passed = len(args)
+        missing = [
+            entry
+            for entry in injected
+            if entry.position >= passed and entry.name not in kwargs
+        ]
+        if not missing:
+            return args
+        skipped: list[Any] = []
+        with resolution.begin(None, self._family.metrics):
+            for entry in missing:
+                resolved = self._resolve_argument(function, entry.param)
+                if entry.positional and resolved is _EMPTY:
+                    skipped.append(entry.param.default)
+                elif entry.positional:
+                    args = (*args, *skipped, resolved)
+                    skipped.clear()
+                elif resolved is not _EMPTY:
+                    kwargs[entry.name] = resolved
+        return args
+
+    def configure_selection(
+        self,
+        key: Hashable,
+        policy: SelectionPolicy | None,
+    ) -> None:
+        """Choose among several providers registered for a key with a policy.
+
+        By default, a type with several registrations is injected from the
+        first one. With a policy, such as `strappy.selection.RoundRobin()`,
+        each injection uses the provider chosen by the policy instead.
+        Children inherit the policy unless they configure their own, and
+        `None` removes it.
+        """
+        with self._write_lock:
+            self._selection = {**self._selection, key: policy}
+            self._changed((key,))
+
+    def selection_policy(self, key: Hashable) -> SelectionPolicy | None:
+        """Get the policy choosing among several providers for a key, if any."""
+        container: Container | None = self
+        while container is not None:
+            if key in container._selection:  # noqa: SLF001
+                return container._selection[key]  # noqa: SLF001
+            container = container.parent
+        return None
+
+    def configure_key_cache(
+        self,
+        *,
+        maxsize: int = 128,
+        on_evict: "EvictionCallback[Self] | None" = None,
+    ) -> None:
+        """Configure the cache of children returned by `for_key`.
+
+        At most `maxsize` children are kept, and the least recently used
+        child is evicted first. `on_evict` is called with the key and child
+        of each evicted child, e.g. to close resources it holds.
+        """
+        keyed = self._key_cache()
+        keyed.maxsize = maxsize
+        keyed.on_evict = on_evict
+
+    def _key_cache(self) -> KeyedChildren[Self]:
+        # Created lazily so that short-lived children stay cheap to extend.
+        if self._keyed is None:
+            with _KEYED_LOCK:
+                if self._keyed is None:
+                    self._keyed = KeyedChildren()
+        return self._keyed
+
+    def for_key(
+        self,
+        key: Hashable,
+        configure: Callable[[Self], object] | None = None,
+    ) -> Self:
+        """Get a cached child container for a key such as a tenant id.
+
+        The first time a key is seen, a new child is created and passed to
+        `configure`. Later calls reuse the same child, together with its
+        cached plans and singletons, until it is evicted.
+        """
+
+        def create() -> Self:
+            child = self.extend()
+            if configure is not None:
+                configure(child)
+            return child
+
+        return self._key_cache().get(key, create)
+
+    def evict_key(self, key: Hashable) -> None:
+        """Drop the cached child container for a key, if any."""
+        if self._keyed is not None:
+            self._keyed.evict(key)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop cached results for a key and everything that was built from it.
+
+        Singletons and other shared results registered for the key are
+        rebuilt when next needed, as are those that depend on the key,
+        directly or transitively. Registrations and unrelated cached results
+        are kept.
+        """
+        stale = set(self.registry.get(key) or ())
+        stale.update(self._family.dependents((key,)))
+        for provider in stale:
+            provider.reset()
+
+    def stats(self) -> dict[Hashable, ProviderStats]:
+        """Get counters per provider key, aggregated over all extended containers.
+
+        Counters are only collected if the root container was created with
+        `collect_stats=True`. Use `strappy.metrics.render_prometheus` to
+        expose them to Prometheus.
+        """
+        metrics = self._family.metrics
+        return metrics.snapshot() if metrics is not None else {}
+
     def extend(self) -> Self:
         """Return a new container extending the current context."""
         return type(self)(strategies=self.strategies, parent=self)
@@ -0,0 +1,44 @@
+"""Tracking of the registry keys that resolutions depend on."""
+
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class _AnyKey:
+    def __repr__(self) -> str:
+        return "ANY_KEY"
+
+
+ANY_KEY = _AnyKey()
+"""Pseudo-key recorded by lookups that depend on every registration."""
+
+_collector: ContextVar[set[Hashable] | None] = ContextVar(
+    "strappy_dependency_collector",
+    default=None,
+)
+
+
+def record(key: Hashable) -> None:
+    """Record that the active resolution depends on a registry key."""
+    collected = _collector.get()
+    if collected is not None:
+        collected.add(key)
+
+
+def record_all(keys: Iterable[Hashable]) -> None:
+    """Record that the active resolution depends on several registry keys."""
+    collected = _collector.get()
+    if collected is not None:
+        collected.update(keys)
+
+
+@contextmanager
+def collect() -> Iterator[set[Hashable]]:
+    """Collect the keys recorded within the block, hiding them from outer blocks."""
+    collected: set[Hashable] = set()
+    token = _collector.set(collected)
+    try:
+        yield collected
+    finally:
+        _collector.reset(token)
@@ -1,8 +1,63 @@
 """Exception types."""
 
+from collections.abc import Sequence
+from typing import Any
+
+from strappy.type_utils import describe
+
 
 class ResolutionError(Exception):
-    """An error due to a missing dependency."""
+    """An error due to a missing dependency.
+
+    The message is only formatted when the error is displayed, from the
+    missing key, the path of parameters that led to it and the strategies
+    that were tried.
+    """
+
+    def __init__(
+        self,
+        key: Any = None,
+        *args: object,
+        strategies: Sequence[Any] = (),
+    ) -> None:
+        """Initialize exception."""
+        super().__init__(*args)
+        self.key = key
+        self.strategies = strategies
+        self.path: list[tuple[Any, str]] = []
+
+    def add_frame(self, dependent: Any, name: str) -> "ResolutionError":
+        """Record that the missing key was needed for a parameter of a callable."""
+        self.path.insert(0, (dependent, name))
+        return self
+
+    def _needed_by(self) -> str:
+        if not self.path:
+            return ""
+        chain = " -> ".join(
+            f"{describe(dependent)}({name})" for dependent, name in self.path
+        )
+        return f" needed by {chain}"
+
+    def __str__(self) -> str:
+        """Describe the missing dependency."""
+        if self.key is None:
+            return super().__str__()
+        message = f"Unable to resolve {describe(self.key)}{self._needed_by()}"
+        if self.strategies:
+            tried = ", ".join(describe(strategy) for strategy in self.strategies)
+            message += f"; tried strategies: {tried}"
+        return message
+
+
+class DeadlineExceededError(ResolutionError):
+    """An error when a dependency could not be built within its time budget."""
+
+    def __str__(self) -> str:
+        """Describe the dependency that ran out of time."""
+        if self.key is None:
+            return super().__str__()
+        return f"Deadline exceeded building {describe(self.key)}{self._needed_by()}"
 
 
 class RegistrationConflictError(Exception):
@@ -40,6 +95,17 @@ class TransientInstanceError(InvalidProviderError):
         super().__init__(message, *args)
 
 
+class WeakReferenceError(InvalidProviderError):
+    """Error when a weak singleton provider builds a result without weakref support."""
+
+    def __init__(self, provides: object = None, *args: object) -> None:
+        """Initialize exception."""
+        message = "Results of weak singleton providers must support weak references"
+        if provides is not None:
+            message += f", but {describe(provides)} does not"
+        super().__init__(message + ".", *args)
+
+
 class NoProviderTypeError(InvalidProviderError):
     """Error when a Provider is unable to determine its type."""
 
@@ -47,3 +113,12 @@ class NoProviderTypeError(InvalidProviderError):
         """Initialize exception."""
         message = "Providers type could not be determined."
         super().__init__(message, *args)
+
+
+class NotImportableError(Exception):
+    """Error when an object cannot be referred to by its import path."""
+
+    def __init__(self, obj: object, *args: object) -> None:
+        """Initialize exception."""
+        message = f"{describe(obj)} cannot be imported by path from another process."
+        super().__init__(message, *args)
@@ -0,0 +1,268 @@
+"""Dependency graphs of a container's providers, optionally with timings."""
+
+import inspect
+import json
+import time
+from collections.abc import Hashable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from strappy import introspection, resolution, type_utils
+from strappy import strategies as st
+from strappy.container import _VARIADIC, Container, _service_param
+from strappy.metrics import Metrics
+from strappy.selection import Selector
+
+if TYPE_CHECKING:
+    from strappy.provider import Provider
+
+
+class Node:
+    """A provider in a dependency graph, or a dependency that has none."""
+
+    __slots__ = (
+        "build_seconds",
+        "cached",
+        "factory",
+        "id",
+        "instances_created",
+        "introspection_seconds",
+        "key",
+        "scope",
+        "strategy",
+    )
+
+    def __init__(
+        self,
+        node_id: str,
+        key: Hashable,
+        provider: "Provider | None",
+        strategy: str | None,
+    ) -> None:
+        """Describe the provider for a key, as chosen by a strategy."""
+        self.id = node_id
+        self.key = key
+        self.scope = provider.scope.value if provider is not None else None
+        self.factory = (
+            type_utils.describe(provider.factory)
+            if provider is not None and provider.factory is not None
+            else None
+        )
+        self.strategy = strategy
+        self.cached = provider is not None and _already_built(provider)
+        self.introspection_seconds = 0.0
+        self.build_seconds: float | None = None
+        self.instances_created: int | None = None
+
+    @property
+    def resolved(self) -> bool:
+        """Whether a provider was found for this node's key."""
+        return self.scope is not None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get a JSON-serializable description of the node."""
+        return {
+            "id": self.id,
+            "key": type_utils.describe(self.key),
+            "resolved": self.resolved,
+            "scope": self.scope,
+            "strategy": self.strategy,
+            "factory": self.factory,
+            "cached": self.cached,
+            "introspection_seconds": self.introspection_seconds,
+            "build_seconds": self.build_seconds,
+            "instances_created": self.instances_created,
+        }
+
+
+class Graph:
+    """Providers needed to resolve some root types, and their dependencies."""
+
+    def __init__(self) -> None:
+        """Start an empty graph."""
+        self.roots: list[Node] = []
+        self.nodes: list[Node] = []
+        self.edges: list[tuple[Node, Node, str]] = []
+
+    def add_node(
+        self,
+        key: Hashable,
+        provider: "Provider | None",
+        strategy: str | None,
+    ) -> Node:
+        """Add a node to the graph."""
+        node = Node(f"n{len(self.nodes)}", key, provider, strategy)
+        self.nodes.append(node)
+        return node
+
+    def to_json(self) -> str:
+        """Render the graph as JSON."""
+        return json.dumps(
+            {
+                "roots": [node.id for node in self.roots],
+                "nodes": [node.as_dict() for node in self.nodes],
+                "edges": [
+                    {"source": source.id, "target": target.id, "param": param}
+                    for source, target, param in self.edges
+                ],
+            },
+            indent=2,
+        )
+
+    def to_dot(self) -> str:
+        """Render the graph in the Graphviz DOT language."""
+        lines = ["digraph strappy {", "  node [shape=box];"]
+        for node in self.nodes:
+            label = [type_utils.describe(node.key)]
+            if node.resolved:
+                label.append(f"scope={node.scope}")
+                label.append(f"strategy={node.strategy}")
+            else:
+                label.append("UNRESOLVED")
+            if node.cached:
+                label.append("cached")
+            if node.build_seconds is not None:
+                label.append(f"build={node.build_seconds * 1000:.3f}ms")
+                label.append(f"instances={node.instances_created}")
+            if node.introspection_seconds:
+                milliseconds = node.introspection_seconds * 1000
+                label.append(f"introspection={milliseconds:.3f}ms")
+            text = _escape("\n".join(label))
+            style = "" if node.resolved else ", color=red"
+            lines.append(f'  {node.id} [label="{text}"{style}];')
+        lines.extend(
+            f'  {source.id} -> {target.id} [label="{_escape(param)}"];'
+            for source, target, param in self.edges
+        )
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+
+def _already_built(provider: "Provider") -> bool:
+    # Instances and built singletons, which resolving builds nothing for
+    result, weak, *_ = provider._cache_state()  # noqa: SLF001
+    return result is not None or (weak is not None and weak() is not None)
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Walker:
+    def __init__(self, container: Container) -> None:
+        self.container = container
+        self.graph = Graph()
+        # Keyed on providers themselves, which keeps them alive, as plans
+        # made for the graph create providers that nothing else refers to.
+        self.nodes: dict[Provider, Node] = {}
+
+    def walk_param(self, param: inspect.Parameter) -> Node | None:
+        # Plans and parameters are looked up afresh, so that introspection
+        # times do not depend on what the container already resolved.
+        start = time.perf_counter()
+        plan = self.container._new_plan(param)  # noqa: SLF001
+        seconds = time.perf_counter() - start
+        if plan.provider is None:
+            if param.default is not inspect._empty:  # noqa: SLF001
+                return None
+            node = self.graph.add_node(param.annotation, None, None)
+        else:
+            strategy = type_utils.describe(plan.chosen_by)
+            node = self.walk_provider(plan.provider, strategy)
+        node.introspection_seconds += seconds
+        return node
+
+    def choices(self, provider: "Provider") -> list[tuple[str, "Provider"]] | None:
+        # Providers of collections and selectors delegate to registered ones
+        if isinstance(provider, Selector):
+            return [
+                (f"choice {index}", choice)
+                for index, choice in enumerate(provider.choices)
+            ]
+        collection_type, inner_type = type_utils.get_collection_type(provider.provides)
+        if collection_type is None:
+            return None
+        registry = self.container.registry
+        return [
+            (f"[{index}]", inner)
+            for index, inner in enumerate(
+                st._search_for_subtypes(inner_type, registry) or [],  # noqa: SLF001
+            )
+        ]
+
+    def walk_delegates(self, node: Node, provider: "Provider") -> bool:
+        # Builders depend on what they build rather than on their parameters
+        if isinstance(provider, st.Builder):
+            child = self.walk_param(_service_param(provider.service))
+            if child is not None:
+                self.graph.edges.append((node, child, "builds"))
+            return True
+        choices = self.choices(provider)
+        if choices is None:
+            return False
+        for label, choice in choices:
+            child = self.walk_provider(choice, "registered")
+            self.graph.edges.append((node, child, label))
+        return True
+
+    def walk_provider(self, provider: "Provider", strategy: str) -> Node:
+        node = self.nodes.get(provider)
+        if node is not None:
+            return node
+        node = self.graph.add_node(provider.provides, provider, strategy)
+        self.nodes[provider] = node
+
+        if self.walk_delegates(node, provider):
+            return node
+
+        if provider.instance is not None or provider.factory is None:
+            return node
+        start = time.perf_counter()
+        params = introspection.read_params(provider.factory)
+        node.introspection_seconds += time.perf_counter() - start
+        provided = provider.registration_kwargs or {}
+        for name, param in params.items():
+            if name in {"self", "cls"} or name in provided:
+                continue
+            if param.kind in _VARIADIC:
+                continue
+            child = self.walk_param(param)
+            if child is not None:
+                self.graph.edges.append((node, child, name))
+        return node
+
+
+def build_graph(
+    container: Container,
+    roots: Iterable[Any],
+    *,
+    timed: bool = False,
+) -> Graph:
+    """Get the dependency graph of some root types in a container.
+
+    Providers are chosen and their parameters read without the caches that
+    resolving uses, so introspection times reflect a cold start. With
+    `timed`, the roots are also resolved and each node records how many
+    instances were built and the total time spent building them, including
+    their dependencies. Nodes whose results were already built, such as
+    singletons the container has resolved before, are marked `cached`, as
+    nothing is built or timed for them.
+    """
+    roots = list(roots)
+    walker = _Walker(container)
+    for root in roots:
+        node = walker.walk_param(_service_param(root))
+        if node is not None:
+            walker.graph.roots.append(node)
+
+    if timed:
+        metrics = Metrics()
+        with resolution.begin(metrics=metrics):
+            for root in roots:
+                walker.container.resolve(root)
+        stats = metrics.snapshot()
+        for node in walker.graph.nodes:
+            node_stats = stats.get(node.key) if node.resolved else None
+            if node_stats is not None:
+                node.build_seconds = node_stats.build_seconds
+                node.instances_created = node_stats.instances_created
+    return walker.graph
@@ -0,0 +1,189 @@
+"""Parameters of callables, read from field metadata where classes declare it.
+
+Dataclasses, attrs classes and pydantic models list their fields, so their
+parameters are read from those declarations instead of building a full
+signature. Results are cached per callable.
+"""
+
+import dataclasses
+import inspect
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import Any
+
+_POSITIONAL = inspect._ParameterKind.POSITIONAL_OR_KEYWORD  # noqa: SLF001
+_KEYWORD_ONLY = inspect._ParameterKind.KEYWORD_ONLY  # noqa: SLF001
+_PYDANTIC_MODULES = {"pydantic", "pydantic_settings"}
+
+
+class DefaultFactory:
+    """Default of a field that is built by a factory when it is omitted."""
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        """Wrap the field's default factory."""
+        self.factory = factory
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by factory."""
+        return isinstance(other, DefaultFactory) and other.factory is self.factory
+
+    def __hash__(self) -> int:
+        """Hash by factory."""
+        return hash(self.factory)
+
+    def __repr__(self) -> str:
+        """Represent the default like `inspect.signature` does."""
+        return "<factory>"
+
+
+def _parameters(
+    fields: list[tuple[str, Any, Any, bool]],
+) -> Mapping[str, inspect.Parameter]:
+    # Fields are (name, annotation, default, keyword_only), in declaration
+    # order; keyword-only fields come after the others, as in `__init__`.
+    ordered = sorted(fields, key=lambda field: field[3])
+    return {
+        name: inspect.Parameter(
+            name,
+            _KEYWORD_ONLY if keyword_only else _POSITIONAL,
+            default=default,
+            annotation=annotation,
+        )
+        for name, annotation, default, keyword_only in ordered
+    }
+
+
+def _generated_init(cls: type) -> bool:
+    # Generated initializers are compiled from source strings, whose file
+    # names look like "<string>", unlike ones written in a class body.
+    code = getattr(cls.__init__, "__code__", None)
+    return code is not None and code.co_filename.startswith("<")
+
+
+def _dataclass_params(cls: type) -> Mapping[str, inspect.Parameter] | None:
+    declared = cls.__dict__.get("__dataclass_fields__")
+    if declared is None or not _generated_init(cls):
+        return None
+    fields = dataclasses.fields(cls)
+    if len(fields) != len(declared):  # InitVar and ClassVar pseudo-fields
+        return None
+    return _parameters(
+        [
+            (
+                field.name,
+                field.type,
+                field.default
+                if field.default is not dataclasses.MISSING
+                else DefaultFactory(field.default_factory)
+                if field.default_factory is not dataclasses.MISSING
+                else inspect._empty,  # noqa: SLF001
+                bool(getattr(field, "kw_only", False)),
+            )
+            for field in fields
+            if field.init
+        ],
+    )
+
+
+def _attrs_default(default: Any) -> Any:
+    if type(default).__name__ == "_Nothing":
+        return inspect._empty  # noqa: SLF001
+    if hasattr(default, "factory") and hasattr(default, "takes_self"):
+        return DefaultFactory(default.factory)
+    return default
+
+
+def _attrs_params(cls: type) -> Mapping[str, inspect.Parameter] | None:
+    attributes = cls.__dict__.get("__attrs_attrs__")
+    if attributes is None or not _generated_init(cls):
+        return None
+    return _parameters(
+        [
+            (
+                getattr(attribute, "alias", None) or attribute.name.lstrip("_"),
+                attribute.type if attribute.type is not None else inspect._empty,  # noqa: SLF001
+                _attrs_default(attribute.default),
+                attribute.kw_only,
+            )
+            for attribute in attributes
+            if attribute.init
+        ],
+    )
+
+
+def _pydantic_params(cls: type) -> Mapping[str, inspect.Parameter] | None:
+    fields = getattr(cls, "model_fields", None)
+    init_module = getattr(cls.__init__, "__module__", None) or ""
+    if not isinstance(fields, dict) or (
+        init_module.partition(".")[0] not in _PYDANTIC_MODULES
+    ):
+        return None
+    # Fields are validated by their validation alias. Choices and paths of
+    # aliases, or models also validating by name, are left to the signature.
+    config = getattr(cls, "model_config", None) or {}
+    if config.get("populate_by_name") or config.get("validate_by_name"):
+        return None
+    names = {}
+    for name, field in fields.items():
+        alias = field.validation_alias or field.alias
+        if alias is not None and not isinstance(alias, str):
+            return None
+        names[name] = alias or name
+    return _parameters(
+        [
+            (
+                names[name],
+                field.annotation,
+                inspect._empty  # noqa: SLF001
+                if field.is_required()
+                else DefaultFactory(field.default_factory)
+                if field.default_factory is not None
+                else field.default,
+                True,
+            )
+            for name, field in fields.items()
+        ],
+    )
+
+
+def _from_fields(f: Callable | type) -> Mapping[str, inspect.Parameter] | None:
+    if not isinstance(f, type):
+        return None
+    for reader in (_dataclass_params, _attrs_params, _pydantic_params):
+        params = reader(f)
+        if params is not None:
+            return params
+    return None
+
+
+def _from_signature(f: Callable | type) -> Mapping[str, inspect.Parameter]:
+    try:
+        sig = inspect.signature(f)
+    except ValueError:
+        sig = inspect.signature(f.__init__)
+    return sig.parameters
+
+
+def read_params(f: Callable | type) -> Mapping[str, inspect.Parameter]:
+    """Read the parameters used to call a callable, bypassing the cache."""
+    params = _from_fields(f)
+    return params if params is not None else _from_signature(f)
+
+
+_cached_params = lru_cache(maxsize=4096)(read_params)
+
+
+def get_params(f: Callable | type) -> Mapping[str, inspect.Parameter]:
+    """Get the parameters used to call a callable, by name.
+
+    For dataclasses, attrs classes and pydantic models with generated
+    initializers, the parameters are read from their field declarations.
+    Fields with a default factory get a `DefaultFactory` default, so they
+    are left out when nothing is registered for them.
+    """
+    try:
+        return _cached_params(f)
+    except TypeError:  # unhashable callable
+        return read_params(f)
@@ -0,0 +1,81 @@
+"""Bounded cache of child containers configured per key."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+ContainerT = TypeVar("ContainerT")
+EvictionCallback = Callable[[Hashable, ContainerT], None]
+
+
+class KeyedChildren(Generic[ContainerT]):
+    """Least recently used cache of child containers, one per key."""
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        on_evict: "EvictionCallback[ContainerT] | None" = None,
+    ) -> None:
+        """Create an empty cache holding at most `maxsize` children."""
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._lock = threading.Lock()
+        self._children: OrderedDict[Hashable, ContainerT] = OrderedDict()
+        self._creating: dict[Hashable, threading.Lock] = {}
+
+    def __len__(self) -> int:
+        """Count the cached children."""
+        return len(self._children)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a child is cached for a key."""
+        return key in self._children
+
+    def _cached(self, key: Hashable) -> ContainerT | None:
+        with self._lock:
+            child = self._children.get(key)
+            if child is not None:
+                self._children.move_to_end(key)
+            return child
+
+    def get(self, key: Hashable, create: Callable[[], ContainerT]) -> ContainerT:
+        """Get the child for a key, creating it at most once if it is missing."""
+        child = self._cached(key)
+        if child is not None:
+            return child
+        with self._lock:
+            creating = self._creating.setdefault(key, threading.Lock())
+        with creating:
+            child = self._cached(key)
+            if child is not None:
+                return child
+            child = create()
+            with self._lock:
+                self._children[key] = child
+                self._creating.pop(key, None)
+                evicted = []
+                while len(self._children) > self.maxsize:
+                    evicted.append(self._children.popitem(last=False))
+        for evicted_key, evicted_child in evicted:
+            self._evicted(evicted_key, evicted_child)
+        return child
+
+    def evict(self, key: Hashable) -> None:
+        """Drop the child for a key, if any."""
+        with self._lock:
+            child = self._children.pop(key, None)
+        if child is not None:
+            self._evicted(key, child)
+
+    def clear(self) -> None:
+        """Drop all children."""
+        with self._lock:
+            evicted = list(self._children.items())
+            self._children.clear()
+        for key, child in evicted:
+            self._evicted(key, child)
+
+    def _evicted(self, key: Hashable, child: ContainerT) -> None:
+        if self.on_evict is not None:
+            self.on_evict(key, child)
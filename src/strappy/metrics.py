@@ -0,0 +1,144 @@
+"""Counters describing what containers build, and a Prometheus exporter."""
+
+import threading
+from collections.abc import Hashable, Mapping
+
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+"""Upper bounds in seconds of the build time histogram buckets."""
+
+
+class ProviderStats:
+    """Counters for the providers registered under one key."""
+
+    __slots__ = (
+        "bucket_counts",
+        "build_seconds",
+        "cache_hits",
+        "cache_misses",
+        "failures",
+        "instances_created",
+    )
+
+    def __init__(self) -> None:
+        """Start all counters at zero."""
+        self.instances_created = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.failures = 0
+        self.build_seconds = 0.0
+        self.bucket_counts = [0] * len(BUCKETS)
+
+    def copy(self) -> "ProviderStats":
+        """Get a copy of these counters."""
+        stats = ProviderStats()
+        stats.instances_created = self.instances_created
+        stats.cache_hits = self.cache_hits
+        stats.cache_misses = self.cache_misses
+        stats.failures = self.failures
+        stats.build_seconds = self.build_seconds
+        stats.bucket_counts = list(self.bucket_counts)
+        return stats
+
+    def __repr__(self) -> str:
+        """Represent the counters."""
+        return (
+            f"{type(self).__name__}(instances_created={self.instances_created}, "
+            f"cache_hits={self.cache_hits}, cache_misses={self.cache_misses}, "
+            f"failures={self.failures}, build_seconds={self.build_seconds:.6f})"
+        )
+
+
+class Metrics:
+    """Thread-safe collector of per-key provider counters."""
+
+    def __init__(self) -> None:
+        """Start without any counters."""
+        self._lock = threading.Lock()
+        self._stats: dict[Hashable, ProviderStats] = {}
+
+    def _for(self, key: Hashable) -> ProviderStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = ProviderStats()
+        return stats
+
+    def record_build(self, key: Hashable, seconds: float, *, cached: bool) -> None:
+        """Record that a provider built an instance, and how long it took."""
+        with self._lock:
+            stats = self._for(key)
+            stats.instances_created += 1
+            stats.cache_misses += cached
+            stats.build_seconds += seconds
+            for index, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    stats.bucket_counts[index] += 1
+                    break
+
+    def record_hit(self, key: Hashable) -> None:
+        """Record that a cached instance was reused."""
+        with self._lock:
+            self._for(key).cache_hits += 1
+
+    def record_failure(self, key: Hashable) -> None:
+        """Record that a key could not be resolved."""
+        with self._lock:
+            self._for(key).failures += 1
+
+    def snapshot(self) -> dict[Hashable, ProviderStats]:
+        """Get a consistent copy of all counters."""
+        with self._lock:
+            return {key: stats.copy() for key, stats in self._stats.items()}
+
+
+def _label(key: Hashable) -> str:
+    if isinstance(key, type):
+        name = f"{key.__module__}.{key.__qualname__}"
+    else:
+        name = repr(key)
+    return name.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(
+    stats: Mapping[Hashable, ProviderStats],
+    prefix: str = "strappy",
+) -> str:
+    """Render counters in the Prometheus text exposition format."""
+    labels = {key: f'key="{_label(key)}"' for key in stats}
+    lines: list[str] = []
+
+    counters = (
+        (
+            "instances_created_total",
+            "Instances built by providers.",
+            "instances_created",
+        ),
+        ("cache_hits_total", "Cached instances reused.", "cache_hits"),
+        (
+            "cache_misses_total",
+            "Cached instances that had to be built.",
+            "cache_misses",
+        ),
+        ("resolution_failures_total", "Failed resolutions.", "failures"),
+    )
+    for name, description, attribute in counters:
+        lines.append(f"# HELP {prefix}_{name} {description}")
+        lines.append(f"# TYPE {prefix}_{name} counter")
+        lines.extend(
+            f"{prefix}_{name}{{{labels[key]}}} {getattr(key_stats, attribute)}"
+            for key, key_stats in stats.items()
+        )
+
+    name = f"{prefix}_build_seconds"
+    lines.append(f"# HELP {name} Time spent building instances.")
+    lines.append(f"# TYPE {name} histogram")
+    for key, key_stats in stats.items():
+        cumulative = 0
+        for bound, count in zip(BUCKETS, key_stats.bucket_counts, strict=True):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels[key]},le="{bound}"}} {cumulative}')
+        total = key_stats.instances_created
+        lines.append(f'{name}_bucket{{{labels[key]},le="+Inf"}} {total}')
+        lines.append(f"{name}_sum{{{labels[key]}}} {key_stats.build_seconds}")
+        lines.append(f"{name}_count{{{labels[key]}}} {total}")
+
+    return "\n".join(lines) + "\n"
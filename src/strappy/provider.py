@@ -1,16 +1,25 @@
 """Dependency providers."""
 
+import asyncio
 import inspect
-from collections.abc import Hashable
+import threading
+import time
+import weakref
+from collections.abc import Callable, Hashable
+from concurrent import futures
 from enum import Enum
+from functools import partial
+from types import FunctionType
 from typing import Any, Generic
 
+from strappy import dependencies, resolution
 from strappy.errors import (
+    DeadlineExceededError,
     MultipleImplementationsError,
     NoImplementationError,
     NoProviderTypeError,
-    ResolutionError,
     TransientInstanceError,
+    WeakReferenceError,
 )
 from strappy.types import ContainerLike, Factory, T
 
@@ -20,6 +29,44 @@ class Scope(Enum):
 
     TRANSIENT = "TRANSIENT"
     SINGLETON = "SINGLETON"
+    RESOLUTION = "RESOLUTION"
+    WEAK_SINGLETON = "WEAK_SINGLETON"
+    THREAD = "THREAD"
+    TASK = "TASK"
+
+
+# Members are read once, as attribute access on enum classes is slow before
+# Python 3.12 and scopes are checked every time a provider is used.
+_TRANSIENT = Scope.TRANSIENT
+_SINGLETON = Scope.SINGLETON
+_RESOLUTION = Scope.RESOLUTION
+_WEAK_SINGLETON = Scope.WEAK_SINGLETON
+_TASK = Scope.TASK
+
+
+class _Release:
+    """Token whose collection releases a per-thread result."""
+
+    __slots__ = ("__weakref__",)
+
+
+_ThreadCached = tuple[Any, frozenset[Hashable], _Release | None]
+
+
+_RUNTIME_STATE = ("_lock", "_threads", "_tasks")
+
+
+def _return_annotation(factory: Callable) -> Any:
+    # Plain functions declare their return annotation directly, which is far
+    # cheaper to read than a full signature. Others, like partials and
+    # wrapped functions, need the signature to be computed.
+    if (
+        isinstance(factory, FunctionType)
+        and "__wrapped__" not in factory.__dict__
+        and "__signature__" not in factory.__dict__
+    ):
+        return factory.__annotations__.get("return", inspect._empty)  # noqa: SLF001
+    return inspect.signature(factory).return_annotation
 
 
 class Provider(Generic[T]):
@@ -35,14 +82,31 @@ class Provider(Generic[T]):
         kwargs: dict[str, Any] | None = None,
         scope: Scope | None = None,
         provides: type[T] | None = None,
+        cleanup: Callable[[T], object] | None = None,
+        timeout: float | None = None,
+        fallback: "Provider[T] | None" = None,
     ) -> None:
-        """Instantiate a new provider."""
+        """Instantiate a new provider.
+
+        `cleanup` is called with results of `Scope.THREAD` and `Scope.TASK`
+        providers once the thread or task they were built for has ended.
+
+        Builds must finish within `timeout` seconds and by the deadline of
+        the resolution, if any, or `DeadlineExceededError` is raised. With a
+        `fallback`, its result is used instead, and is not cached.
+        """
         self.factory = factory
         self.instance = instance
         self.registration_kwargs = kwargs
         self.scope = scope or Scope.TRANSIENT
         self.provides = provides or self._get_type()
+        self.cleanup = cleanup
+        self.timeout = timeout
+        self.fallback = fallback
         self._result = None
+        self._weak: weakref.ref[Any] | None = None
+        self._dependencies: frozenset[Hashable] | None = None
+        self._start_runtime_state()
 
         if self.instance is not None:
             self._result = self.instance
@@ -58,6 +122,50 @@ class Provider(Generic[T]):
 
         return Provider
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the provider's configuration, without its lock or cached result.
+
+        Providers made by `Provider[...]` are pickled as plain providers, as
+        their classes cannot be imported.
+        """
+        cls: type[Provider] = type(self)
+        while "<locals>" in cls.__qualname__:
+            cls = cls.__mro__[1]
+        state = self.__dict__.copy()
+        for name in _RUNTIME_STATE:
+            del state[name]
+        state["_weak"] = None
+        if self.instance is None:
+            state["_result"] = None
+            state["_dependencies"] = None
+        return _unpickle, (cls, state)
+
+    def _start_runtime_state(self) -> None:
+        # Locks and per-thread and per-task caches, which are not pickled.
+        # The caches are only created when first needed, as most providers
+        # never use them and creating them dominates registration time.
+        self._lock = threading.RLock()
+        self._threads: weakref.WeakKeyDictionary[object, _ThreadCached] | None = None
+        self._tasks: dict[asyncio.Task, tuple[Any, frozenset[Hashable]]] | None = None
+
+    def _thread_cache(self) -> weakref.WeakKeyDictionary[object, _ThreadCached]:
+        threads = self._threads
+        if threads is None:
+            with self._lock:
+                threads = self._threads
+                if threads is None:
+                    threads = self._threads = weakref.WeakKeyDictionary()
+        return threads
+
+    def _task_cache(self) -> dict[asyncio.Task, tuple[Any, frozenset[Hashable]]]:
+        tasks = self._tasks
+        if tasks is None:
+            with self._lock:
+                tasks = self._tasks
+                if tasks is None:
+                    tasks = self._tasks = {}
+        return tasks
+
     def _get_type(self) -> Any:
         if getattr(self, "provides", None):
             return self.provides
@@ -66,7 +174,7 @@ class Provider(Generic[T]):
         if isinstance(self.factory, type):
             return self.factory
         if self.factory is not None:
-            return_annotation = inspect.signature(self.factory).return_annotation
+            return_annotation = _return_annotation(self.factory)
             if return_annotation is inspect._empty:  # noqa: SLF001
                 raise NoProviderTypeError
             return return_annotation
@@ -93,27 +201,298 @@ class Provider(Generic[T]):
                 **(self.registration_kwargs or {}),
                 **(kwargs or {}),
             }
-            try:
-                result = resolver.call(self.factory, kwargs=build_kwargs)
-            except TypeError as exc:
-                raise ResolutionError from exc
-            return result
+            return resolver.call(self.factory, kwargs=build_kwargs)
         raise NoImplementationError
 
-    def get(
+    def _create(
         self,
         resolver: ContainerLike,
+        active: "resolution.Resolution | None",
         args: tuple = (),
         kwargs: dict[str, Any] | None = None,
+        *,
+        cached: bool = False,
     ) -> T:
-        """Get result from provider."""
-        if self.scope == Scope.SINGLETON:
-            if self._result is not None:
-                return self._result
-            if kwargs:
-                # Resolution kwargs are silently ignored for singletons
-                kwargs = None
+        deadline = resolution.deadline(active)
+        if self.timeout is not None:
+            own = time.monotonic() + self.timeout
+            deadline = own if deadline is None else min(deadline, own)
+        if deadline is None:
+            return self._measure(resolver, active, args, kwargs, cached=cached)
+        return self._create_by(deadline, resolver, active, args, kwargs, cached=cached)
+
+    def _create_by(
+        self,
+        deadline: float,
+        resolver: ContainerLike,
+        active: "resolution.Resolution | None",
+        args: tuple = (),
+        kwargs: dict[str, Any] | None = None,
+        *,
+        cached: bool = False,
+    ) -> T:
+        # Running builds can only be abandoned when they run on an executor;
+        # otherwise the deadline is checked before starting them.
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            build = partial(
+                self._measure, resolver, active, args, kwargs, cached=cached
+            )
+            if active is None:
+                return build()
+            with active.building(self.provides):
+                if active.executor is None:
+                    return build()
+                future = resolution.submit(active.executor, build)
+                # Waiting on one of the executor's own workers for a build that
+                # is still queued would starve a bounded pool, so it is taken back.
+                if resolution.offloaded() and future.cancel():
+                    return build()
+                try:
+                    return future.result(timeout=remaining)
+                except futures.TimeoutError:
+                    future.cancel()
+        if active is not None and active.metrics is not None:
+            active.metrics.record_failure(self.provides)
+        raise DeadlineExceededError(self.provides)
+
+    def _measure(
+        self,
+        resolver: ContainerLike,
+        active: "resolution.Resolution | None",
+        args: tuple = (),
+        kwargs: dict[str, Any] | None = None,
+        *,
+        cached: bool = False,
+    ) -> T:
+        metrics = active.metrics if active is not None else None
+        if metrics is None:
+            return self._build(resolver, args=args, kwargs=kwargs)
+        start = time.perf_counter()
         result = self._build(resolver, args=args, kwargs=kwargs)
-        if self.scope == Scope.SINGLETON:
-            self._result = result
+        metrics.record_build(
+            self.provides,
+            time.perf_counter() - start,
+            cached=cached,
+        )
+        return result
+
+    def get(
+        self,
+        resolver: ContainerLike,
+        args: tuple = (),
+        kwargs: dict[str, Any] | None = None,
+    ) -> T:
+        """Get result from provider, or from its fallback if it ran out of time."""
+        if self.fallback is None:
+            return self._get(resolver, args=args, kwargs=kwargs)
+        try:
+            return self._get(resolver, args=args, kwargs=kwargs)
+        except DeadlineExceededError:
+            # The deadline has passed, so only the fallback's own timeout applies
+            with resolution.without_deadline():
+                return self.fallback.get(resolver, args=args, kwargs=kwargs)
+
+    def _get(
+        self,
+        resolver: ContainerLike,
+        args: tuple = (),
+        kwargs: dict[str, Any] | None = None,
+    ) -> T:
+        active = resolution.current()
+        scope = self.scope
+        if scope is _SINGLETON:
+            return self._get_singleton(resolver, active, args=args)
+        if scope is _RESOLUTION and active is not None:
+            return self._get_per_resolution(resolver, active, args=args)
+        if scope is _TRANSIENT or scope is _RESOLUTION:
+            return self._create(resolver, active, args=args, kwargs=kwargs)
+        if scope is _WEAK_SINGLETON:
+            return self._get_weak(resolver, active, args=args)
+        if scope is _TASK:
+            return self._get_per_task(resolver, active, args=args)
+        return self._get_per_thread(resolver, active, args=args)
+
+    def _get_singleton(
+        self,
+        resolver: ContainerLike,
+        active: "resolution.Resolution | None",
+        args: tuple = (),
+    ) -> T:
+        hit = True
+        if self._result is None:
+            with self._lock:
+                if self._result is None:
+                    hit = False
+                    # Resolution kwargs are silently ignored for singletons
+                    with dependencies.collect() as built_from:
+                        result = self._create(resolver, active, args=args, cached=True)
+                    self._dependencies = frozenset(built_from)
+                    self._result = result
+        if hit and active is not None and active.metrics is not None:
+            active.metrics.record_hit(self.provides)
+        if self._dependencies:
+            dependencies.record_all(self._dependencies)
+        return self._result
+
+    def _get_weak(
+        self,
+        resolver: ContainerLike,
+        active: "resolution.Resolution | None",
+        args: tuple = (),
+    ) -> T:
+        # Strong references are only held by consumers, so the result can be
+        # reclaimed once they are all gone and is then rebuilt on demand.
+        ref = self._weak
+        result = ref() if ref is not None else None
+        hit = result is not None
+        if result is None:
+            with self._lock:
+                ref = self._weak
+                result = ref() if ref is not None else None
+                if result is None:
+                    with dependencies.collect() as built_from:
+                        result = self._create(resolver, active, args=args, cached=True)
+                    try:
+                        self._weak = weakref.ref(result)
+                    except TypeError:
+                        raise WeakReferenceError(self.provides) from None
+                    self._dependencies = frozenset(built_from)
+        if hit and active is not None and active.metrics is not None:
+            active.metrics.record_hit(self.provides)
+        if self._dependencies:
+            dependencies.record_all(self._dependencies)
         return result
+
+    def _get_per_thread(
+        self,
+        resolver: ContainerLike,
+        active: "resolution.Resolution | None",
+        args: tuple = (),
+    ) -> T:
+        # Results are kept for the thread that started the resolution, even
+        # when built on an executor, and are dropped along with its token when
+        # that thread ends, which triggers the cleanup.
+        thread = active.thread if active is not None else resolution.current_thread()
+        threads = self._thread_cache()
+        with self._lock:
+            cached = threads.get(thread)
+        if cached is None:
+            with dependencies.collect() as built_from:
+                result = self._create(resolver, active, args=args, cached=True)
+            release = None
+            if self.cleanup is not None:
+                release = _Release()
+                weakref.finalize(release, self.cleanup, result)
+            # A concurrent branch may have built one first; the result built
+            # here is then released along with its token.
+            with self._lock:
+                cached = threads.setdefault(
+                    thread, (result, frozenset(built_from), release)
+                )
+                self._dependencies = cached[1]
+        elif active is not None and active.metrics is not None:
+            active.metrics.record_hit(self.provides)
+        result, built_from, _ = cached
+        dependencies.record_all(built_from)
+        return result
+
+    def _get_per_task(
+        self,
+        resolver: ContainerLike,
+        active: "resolution.Resolution | None",
+        args: tuple = (),
+    ) -> T:
+        task = active.task if active is not None else resolution.current_task()
+        if task is None:
+            return self._get_per_thread(resolver, active, args=args)
+        tasks = self._task_cache()
+        with self._lock:
+            cached = tasks.get(task)
+        if cached is None:
+            with dependencies.collect() as built_from:
+                result = self._create(resolver, active, args=args, cached=True)
+            with self._lock:
+                cached = tasks.setdefault(task, (result, frozenset(built_from)))
+                self._dependencies = cached[1]
+            if cached[0] is result:
+                self._on_task_done(task, partial(self._task_done, tasks))
+            elif self.cleanup is not None:
+                # A concurrent branch of the task built one first.
+                self.cleanup(result)
+        elif active is not None and active.metrics is not None:
+            active.metrics.record_hit(self.provides)
+        result, built_from = cached
+        dependencies.record_all(built_from)
+        return result
+
+    @staticmethod
+    def _on_task_done(
+        task: asyncio.Task, callback: Callable[[asyncio.Task], object]
+    ) -> None:
+        # Done callbacks can only be added from the task's event loop thread,
+        # and branches of its resolution may be running on an executor.
+        loop = task.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:  # no running event loop
+            running = None
+        if running is loop:
+            task.add_done_callback(callback)
+        else:
+            loop.call_soon_threadsafe(task.add_done_callback, callback)
+
+    def _task_done(
+        self,
+        tasks: dict[asyncio.Task, tuple[Any, frozenset[Hashable]]],
+        task: asyncio.Task,
+    ) -> None:
+        with self._lock:
+            cached = tasks.pop(task, None)
+        if cached is not None and self.cleanup is not None:
+            self.cleanup(cached[0])
+
+    def reset(self) -> None:
+        """Drop cached results so that they are rebuilt when next needed."""
+        if self.instance is None:
+            self._result = None
+            self._weak = None
+            self._threads = None
+            self._tasks = None
+            self._dependencies = None
+
+    def _cache_state(self) -> tuple[Any, ...]:
+        return self._result, self._weak, self._threads, self._tasks, self._dependencies
+
+    def _restore_cache_state(self, state: tuple[Any, ...]) -> None:
+        self._result, self._weak, self._threads, self._tasks, self._dependencies = state
+
+    def _get_per_resolution(
+        self,
+        resolver: ContainerLike,
+        active: "resolution.Resolution",
+        args: tuple = (),
+    ) -> T:
+        hit = True
+        shared = active.instances.get(self)
+        if shared is None:
+            with active.lock_for(self):
+                shared = active.instances.get(self)
+                if shared is None:
+                    hit = False
+                    # Like singletons, shared instances ignore resolution kwargs
+                    with dependencies.collect() as built_from:
+                        result = self._create(resolver, active, args=args, cached=True)
+                    shared = active.instances[self] = (result, built_from)
+        if hit and active.metrics is not None:
+            active.metrics.record_hit(self.provides)
+        result, built_from = shared
+        dependencies.record_all(built_from)
+        return result
+
+
+def _unpickle(cls: type[Provider], state: dict[str, Any]) -> Provider:
+    provider = cls.__new__(cls)
+    provider.__dict__.update(state)
+    provider._start_runtime_state()  # noqa: SLF001
+    return provider
@@ -0,0 +1,173 @@
+"""Registry overlays shared between a container and its extensions."""
+
+import threading
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary, WeakSet
+
+from strappy import dependencies
+
+if TYPE_CHECKING:
+    from strappy.metrics import Metrics
+    from strappy.provider import Provider
+
+
+class _Missing: ...
+
+
+MISSING: Any = _Missing()
+
+
+class Family:
+    """Mutation bookkeeping shared by a root container and all its extensions."""
+
+    def __init__(self) -> None:
+        """Start a new family at generation zero.
+
+        The generation counts every change in the family, and stamps the
+        keys that changed. The epoch only counts changes to containers that
+        have been extended, which are the changes that affect more than one
+        container's view.
+        """
+        self.generation = 0
+        self.epoch = 0
+        self.metrics: Metrics | None = None
+        self._lock = threading.Lock()
+        self._modified_at: dict[Hashable, int] = {}
+        self._dependents: dict[Hashable, WeakSet[Provider]] = {}
+        self._indexed: WeakKeyDictionary[Provider, frozenset] = WeakKeyDictionary()
+
+    def bump(self, keys: Iterable[Hashable], *, shared: bool = True) -> int:
+        """Record that the registrations for some keys have changed.
+
+        Changes that are not `shared` only affect the container they were
+        made on, and leave the epoch as it is. Returns the new generation.
+        """
+        with self._lock:
+            generation = self.generation + 1
+            for key in keys:
+                self._modified_at[key] = generation
+            self._modified_at[dependencies.ANY_KEY] = generation
+            self.generation = generation
+            if shared:
+                self.epoch += 1
+            return generation
+
+    def unchanged_since(self, keys: Iterable[Hashable], generation: int) -> bool:
+        """Check that none of the keys have changed after a generation."""
+        modified_at = self._modified_at
+        return all(modified_at.get(key, 0) <= generation for key in keys)
+
+    def index_singleton(self, provider: "Provider") -> None:
+        """Index a built singleton under the keys it was built from."""
+        built_from = provider._dependencies  # noqa: SLF001
+        if not built_from or self._indexed.get(provider) is built_from:
+            return
+        with self._lock:
+            self._indexed[provider] = built_from
+            for key in built_from:
+                self._dependents.setdefault(key, WeakSet()).add(provider)
+
+    def dependents(self, keys: Iterable[Hashable]) -> set["Provider"]:
+        """Get the built singletons that depend on any of the keys."""
+        found: set[Provider] = set()
+        with self._lock:
+            for key in keys:
+                found.update(self._dependents.get(key, ()))
+        return found
+
+
+class Layer:
+    """View of one container's own registrations on top of its parent's layer.
+
+    A layer is built for a family epoch and a stamp of its container's own
+    changes, and memoizes every lookup, so repeated lookups cost one dict
+    access regardless of how deep the chain of extended containers is.
+    Registries are never mutated once published, so layers can be read
+    concurrently without locking.
+    """
+
+    __slots__ = ("_keys", "_memo", "epoch", "own", "parent", "stamp")
+
+    def __init__(
+        self,
+        own: Mapping[Hashable, list["Provider"]],
+        parent: "Layer | None",
+        epoch: int,
+        stamp: int,
+    ) -> None:
+        """Create a layer over a container's own registrations."""
+        self.own = own
+        self.parent = parent
+        self.epoch = epoch
+        self.stamp = stamp
+        self._memo: dict[Hashable, Any] = {}
+        self._keys: list[Hashable] | None = None
+
+    def lookup(self, key: Hashable) -> Any:
+        """Get the providers registered for a key, or `MISSING`."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        found = self.own.get(key, MISSING)
+        if found is MISSING and self.parent is not None:
+            found = self.parent.lookup(key)
+        self._memo[key] = found
+        return found
+
+    def keys(self) -> list[Hashable]:
+        """Get all keys visible from this layer, ancestors' first."""
+        if self._keys is None:
+            merged = dict.fromkeys(self.parent.keys()) if self.parent else {}
+            merged.update(dict.fromkeys(self.own))
+            self._keys = list(merged)
+        return self._keys
+
+
+class RegistryView(Mapping[Hashable, list["Provider"]]):
+    """Read-only snapshot of the registrations visible from a container.
+
+    A view is bound to the layer that was current when it was taken, so
+    consecutive lookups through it agree with each other even if providers
+    are registered or removed concurrently.
+    """
+
+    __slots__ = ("_layer",)
+
+    def __init__(self, layer: Layer) -> None:
+        """Wrap a container's layer."""
+        self._layer = layer
+
+    def __getitem__(self, key: Hashable) -> list["Provider"]:
+        """Get the providers registered for a key."""
+        dependencies.record(key)
+        found = self._layer.lookup(key)
+        if found is MISSING:
+            raise KeyError(key)
+        return found
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is registered."""
+        dependencies.record(key)
+        return self._layer.lookup(key) is not MISSING  # type: ignore[reportArgumentType]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the providers registered for a key, or a default."""
+        dependencies.record(key)
+        found = self._layer.lookup(key)
+        return default if found is MISSING else found
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over registered keys."""
+        dependencies.record(dependencies.ANY_KEY)
+        return iter(self._layer.keys())
+
+    def __len__(self) -> int:
+        """Count registered keys."""
+        dependencies.record(dependencies.ANY_KEY)
+        return len(self._layer.keys())
+
+    def __repr__(self) -> str:
+        """Represent the view like the dictionary it stands in for."""
+        return f"{type(self).__name__}({dict(self)!r})"
@@ -0,0 +1,258 @@
+"""State shared by everything built for a single resolution."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager as ContextManager
+from contextlib import contextmanager
+from contextvars import ContextVar, Token, copy_context
+from typing import TYPE_CHECKING, Any
+
+from strappy.errors import DeadlineExceededError
+
+if TYPE_CHECKING:
+    import inspect
+    from concurrent.futures import Executor, Future
+
+    from strappy.metrics import Metrics
+
+
+class _Thread:
+    """Token that lives exactly as long as the thread it was made for."""
+
+    __slots__ = ("__weakref__",)
+
+
+_threads = threading.local()
+
+
+def current_thread() -> object:
+    """Get the calling thread's token, dropped by the interpreter when it ends."""
+    try:
+        return _threads.token
+    except AttributeError:
+        token = _threads.token = _Thread()
+        return token
+
+
+def current_task() -> "asyncio.Task | None":
+    """Get the asyncio task running in the calling thread, if any."""
+    loop = asyncio._get_running_loop()  # noqa: SLF001
+    return None if loop is None else asyncio.current_task(loop)
+
+
+_Path = tuple[tuple[Any, str], ...]
+_path: ContextVar[_Path] = ContextVar("strappy_path", default=())
+_no_deadline: ContextVar[bool] = ContextVar("strappy_no_deadline", default=False)
+
+
+class Resolution:
+    """Instances and signatures shared across one resolution graph."""
+
+    __slots__ = (
+        "_building",
+        "_exits",
+        "_guard",
+        "_locks",
+        "deadline",
+        "executor",
+        "instances",
+        "metrics",
+        "params",
+        "task",
+        "thread",
+    )
+
+    def __init__(
+        self,
+        executor: "Executor | None" = None,
+        metrics: "Metrics | None" = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Start an empty resolution, optionally building on an executor.
+
+        The `deadline` is a `time.monotonic()` time by which every build
+        must have finished. The thread and task starting the resolution are
+        recorded, so that results scoped to them are shared by every branch,
+        including branches running on the executor.
+        """
+        self.executor = executor
+        self.metrics = metrics
+        self.deadline = deadline
+        self.thread = current_thread()
+        self.task = current_task()
+        self.instances: dict[Hashable, Any] = {}
+        self.params: dict[Callable, Mapping[str, inspect.Parameter]] = {}
+        self._guard = threading.Lock()
+        self._locks: dict[Hashable, threading.RLock] = {}
+        self._exits: list[Callable[[], object]] = []
+        self._building: list[tuple[Hashable, _Path]] = []
+
+    def on_exit(self, callback: Callable[[], object]) -> None:
+        """Call a function once the resolution has finished."""
+        with self._guard:
+            self._exits.append(callback)
+
+    def lock_for(self, key: Hashable) -> "threading.RLock":
+        """Get the lock guarding the shared instance for a key."""
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.RLock()
+            return lock
+
+    @contextmanager
+    def needing(self, dependent: Any, name: str) -> Iterator[None]:
+        """Record that the block resolves a parameter of a callable."""
+        token = _path.set((*_path.get(), (dependent, name)))
+        try:
+            yield
+        finally:
+            _path.reset(token)
+
+    @contextmanager
+    def building(self, key: Hashable) -> Iterator[None]:
+        """Record that the block builds a key, along the path that needed it."""
+        build = (key, _path.get())
+        with self._guard:
+            self._building.append(build)
+        try:
+            yield
+        finally:
+            with self._guard:
+                self._building.remove(build)
+
+    def overdue(self, key: Hashable) -> DeadlineExceededError:
+        """Describe the deepest build still running, or `key` if there is none."""
+        with self._guard:
+            building, path = max(
+                self._building,
+                key=lambda build: len(build[1]),
+                default=(key, ()),
+            )
+        error = DeadlineExceededError(building)
+        error.path.extend(path)
+        return error
+
+    def gather(self, tasks: Sequence[Callable[[], Any]]) -> list[Any]:
+        """Run independent tasks, concurrently if the resolution has an executor.
+
+        The calling thread runs the first task itself, and takes back any
+        submitted task that has not started by the time its result is needed,
+        so nested gathers cannot starve a bounded pool.
+        """
+        executor = self.executor
+        if executor is None or len(tasks) < 2:  # noqa: PLR2004
+            return [task() for task in tasks]
+        futures = [submit(executor, task) for task in tasks[1:]]
+        try:
+            results = [tasks[0]()]
+            results.extend(
+                task() if future.cancel() else future.result()
+                for task, future in zip(tasks[1:], futures, strict=True)
+            )
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return results
+
+
+_active: ContextVar[Resolution | None] = ContextVar(
+    "strappy_resolution",
+    default=None,
+)
+_offloaded: ContextVar[bool] = ContextVar("strappy_offloaded", default=False)
+
+
+def _run_offloaded(task: Callable[[], Any]) -> Any:
+    _offloaded.set(True)
+    return task()
+
+
+def deadline(active: Resolution | None) -> float | None:
+    """Get the deadline that builds must meet, unless it has been lifted."""
+    if active is None or active.deadline is None or _no_deadline.get():
+        return None
+    return active.deadline
+
+
+@contextmanager
+def without_deadline() -> Iterator[None]:
+    """Lift the resolution's deadline for the block, such as to build fallbacks."""
+    token = _no_deadline.set(True)
+    try:
+        yield
+    finally:
+        _no_deadline.reset(token)
+
+
+def submit(executor: "Executor", task: Callable[[], Any]) -> "Future[Any]":
+    """Run a task on an executor, in a copy of the calling context."""
+    return executor.submit(copy_context().run, _run_offloaded, task)
+
+
+def offloaded() -> bool:
+    """Check whether the caller runs on a task submitted with `submit`."""
+    return _offloaded.get()
+
+
+def current() -> Resolution | None:
+    """Get the resolution in progress, if any."""
+    return _active.get()
+
+
+class _Begin:
+    """Context joining the resolution in progress or starting a new one."""
+
+    __slots__ = ("_deadline", "_executor", "_metrics", "_started", "_token")
+
+    def __init__(
+        self,
+        executor: "Executor | None",
+        metrics: "Metrics | None",
+        deadline: float | None,
+        prepared: Resolution | None,
+    ) -> None:
+        self._executor = executor
+        self._metrics = metrics
+        self._deadline = deadline
+        self._started = prepared
+        self._token: Token[Resolution | None] | None = None
+
+    def __enter__(self) -> Resolution:
+        active = _active.get()
+        if active is not None:
+            return active
+        active = self._started
+        if active is None:
+            active = self._started = Resolution(
+                self._executor,
+                self._metrics,
+                self._deadline,
+            )
+        self._token = _active.set(active)
+        return active
+
+    def __exit__(self, *exc_info: object) -> None:
+        started = self._started
+        if started is None or self._token is None:
+            return
+        _active.reset(self._token)
+        for callback in started._exits:  # noqa: SLF001
+            callback()
+
+
+def begin(
+    executor: "Executor | None" = None,
+    metrics: "Metrics | None" = None,
+    deadline: float | None = None,
+    *,
+    prepared: Resolution | None = None,
+) -> ContextManager[Resolution]:
+    """Join the resolution in progress or start a new one for the block.
+
+    A `prepared` resolution is started instead of a new one, such as one
+    created by a coroutine before handing its resolution to an executor.
+    """
+    return _Begin(executor, metrics, deadline, prepared)
@@ -0,0 +1,155 @@
+"""Policies for choosing among several providers registered for the same type."""
+
+import itertools
+import random
+import threading
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any
+
+from strappy import resolution
+from strappy.provider import Provider
+from strappy.types import ContainerLike, T
+
+SelectionPolicy = Callable[[Sequence[Provider]], Provider]
+"""Callable choosing which of the registered providers to use."""
+
+
+class RoundRobin:
+    """Use each registered provider in turn."""
+
+    def __init__(self) -> None:
+        """Start with the first provider."""
+        self._counter = itertools.count()
+
+    def __call__(self, providers: Sequence[Provider]) -> Provider:
+        """Choose the next provider."""
+        return providers[next(self._counter) % len(providers)]
+
+
+class Random:
+    """Use a registered provider chosen at random, optionally weighted."""
+
+    def __init__(
+        self,
+        weights: Sequence[float] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Choose uniformly, or by weights in registration order."""
+        self.weights = weights
+        self._random = random.Random(seed)  # noqa: S311
+
+    def __call__(self, providers: Sequence[Provider]) -> Provider:
+        """Choose a random provider."""
+        return self._random.choices(providers, weights=self.weights)[0]
+
+
+class LeastInFlight:
+    """Use the provider whose results are in use by the fewest callers.
+
+    A provider counts as in flight from the moment it is chosen until the
+    outermost `resolve` or `call` that chose it returns, or, within `lease`,
+    until the lease ends, so that the time results are actually used counts.
+    Providers that are equally busy are used in turn.
+    """
+
+    def __init__(self) -> None:
+        """Start with nothing in flight."""
+        self._lock = threading.Lock()
+        self._in_flight: dict[Provider, int] = {}
+        self._turn = itertools.count()
+        self._leases: ContextVar[list[Provider] | None] = ContextVar(
+            f"strappy_lease_{id(self)}",
+            default=None,
+        )
+
+    def __call__(self, providers: Sequence[Provider]) -> Provider:
+        """Choose the least busy provider, taking turns among equally busy ones."""
+        with self._lock:
+            in_flight = self._in_flight
+            start = next(self._turn) % len(providers)
+            chosen = min(
+                (*providers[start:], *providers[:start]),
+                key=lambda provider: in_flight.get(provider, 0),
+            )
+            in_flight[chosen] = in_flight.get(chosen, 0) + 1
+        return chosen
+
+    @contextmanager
+    def lease(self) -> Iterator[None]:
+        """Keep the providers chosen within the block in flight until it exits.
+
+        Wrap the code using the resolved results, such as a whole request
+        handler, so that providers count as busy for as long as their
+        results are used rather than only while they are resolved.
+        """
+        held: list[Provider] = []
+        token = self._leases.set(held)
+        try:
+            yield
+        finally:
+            self._leases.reset(token)
+            for provider in held:
+                self.release(provider)
+
+    def release_later(self, provider: Provider) -> bool:
+        """Release a chosen provider when its lease or resolution ends.
+
+        Returns whether the release was scheduled, which it cannot be
+        outside of both, in which case the caller releases it when done.
+        """
+        held = self._leases.get()
+        if held is not None:
+            held.append(provider)
+            return True
+        active = resolution.current()
+        if active is None:
+            return False
+        active.on_exit(partial(self.release, provider))
+        return True
+
+    def release(self, provider: Provider) -> None:
+        """Record that a caller given a provider has finished with it."""
+        with self._lock:
+            count = self._in_flight.get(provider, 0) - 1
+            if count > 0:
+                self._in_flight[provider] = count
+            else:
+                self._in_flight.pop(provider, None)
+
+    def in_flight(self, provider: Provider) -> int:
+        """Count the callers currently given a provider."""
+        return self._in_flight.get(provider, 0)
+
+
+class Selector(Provider[T]):
+    """Provider delegating each request to one of several providers."""
+
+    def __init__(
+        self,
+        choices: Sequence[Provider],
+        policy: SelectionPolicy,
+        provides: Hashable,
+    ) -> None:
+        """Choose among providers registered for a key with a policy."""
+        super().__init__(factory=policy, provides=provides)  # type: ignore[reportArgumentType]
+        self.choices = tuple(choices)
+        self.policy = policy
+
+    def get(
+        self,
+        resolver: ContainerLike,
+        args: tuple = (),  # noqa: ARG002
+        kwargs: dict[str, Any] | None = None,
+    ) -> T:
+        """Get a result from the provider chosen by the policy."""
+        provider = self.policy(self.choices)
+        release_later = getattr(self.policy, "release_later", None)
+        if release_later is None or release_later(provider):
+            return resolver.provide(provider, kwargs=kwargs)
+        try:
+            return resolver.provide(provider, kwargs=kwargs)
+        finally:
+            self.policy.release(provider)  # type: ignore[attr-defined]
@@ -0,0 +1,159 @@
+"""Picklable specifications for rebuilding containers in worker processes."""
+
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+from strappy.container import Container, RegisterMode
+from strappy.errors import NotImportableError
+from strappy.provider import Provider, Scope
+from strappy.type_utils import load
+
+
+def import_path(obj: Any) -> str:
+    """Get the `module:attribute` path that imports an object.
+
+    Raises `NotImportableError` for objects such as lambdas and closures,
+    which another process could not import.
+    """
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not module or not qualname or "<locals>" in qualname:
+        raise NotImportableError(obj)
+    path = f"{module}:{qualname}"
+    try:
+        found = load(path)
+    except (ImportError, AttributeError):
+        found = None
+    if found is not obj:
+        raise NotImportableError(obj)
+    return path
+
+
+class ProviderSpec:
+    """Picklable description of a registered provider.
+
+    Factories are referred to by import path. Instances and registration
+    kwargs are pickled by value, so types that pickle by reference, such as
+    `multiprocessing.shared_memory.SharedMemory`, can share read-only data
+    with workers instead of copying it.
+    """
+
+    __slots__ = (
+        "cleanup",
+        "factory",
+        "fallback",
+        "instance",
+        "kwargs",
+        "provides",
+        "scope",
+        "timeout",
+    )
+
+    def __init__(
+        self,
+        provides: Hashable,
+        scope: str,
+        *,
+        factory: str | None = None,
+        instance: Any = None,
+        kwargs: dict[str, Any] | None = None,
+        cleanup: str | None = None,
+        timeout: float | None = None,
+        fallback: "ProviderSpec | None" = None,
+    ) -> None:
+        """Describe a provider by its key, scope and implementation."""
+        self.provides = provides
+        self.scope = scope
+        self.factory = factory
+        self.instance = instance
+        self.kwargs = kwargs
+        self.cleanup = cleanup
+        self.timeout = timeout
+        self.fallback = fallback
+
+    @classmethod
+    def of(cls, provider: Provider) -> "ProviderSpec":
+        """Describe an existing provider."""
+        return cls(
+            provides=provider.provides,
+            scope=provider.scope.value,
+            factory=import_path(provider.factory) if provider.factory else None,
+            instance=provider.instance,
+            kwargs=provider.registration_kwargs,
+            cleanup=import_path(provider.cleanup) if provider.cleanup else None,
+            timeout=provider.timeout,
+            fallback=cls.of(provider.fallback) if provider.fallback else None,
+        )
+
+    def build(self) -> Provider:
+        """Create a new provider from the description."""
+        return Provider(
+            factory=load(self.factory) if self.factory else None,
+            instance=self.instance,
+            kwargs=self.kwargs,
+            scope=Scope(self.scope),
+            provides=self.provides,  # type: ignore[reportArgumentType]
+            cleanup=load(self.cleanup) if self.cleanup else None,
+            timeout=self.timeout,
+            fallback=self.fallback.build() if self.fallback else None,
+        )
+
+
+class ContainerSpec:
+    """Picklable description of a container's registrations and strategies.
+
+    Pass it to worker processes, e.g. as `initargs` of a
+    `ProcessPoolExecutor`, and call `build` there to get an equivalent
+    container without re-registering everything by hand. Cached singletons
+    are not included, so each worker builds its own.
+    """
+
+    __slots__ = ("cleared", "collect_stats", "providers", "strategies")
+
+    def __init__(
+        self,
+        providers: Sequence[ProviderSpec],
+        strategies: Sequence[str],
+        cleared: Sequence[Hashable] = (),
+        *,
+        collect_stats: bool = False,
+    ) -> None:
+        """Describe a container by its providers and strategy import paths."""
+        self.providers = list(providers)
+        self.strategies = list(strategies)
+        self.cleared = list(cleared)
+        self.collect_stats = collect_stats
+
+    @classmethod
+    def of(cls, container: Container) -> "ContainerSpec":
+        """Describe a container, flattening the registrations of its ancestors.
+
+        Raises `NotImportableError` if a factory or strategy cannot be
+        imported by path, so that mistakes surface before any worker starts.
+        """
+        registry = container.registry
+        providers = []
+        cleared = []
+        for key in registry:
+            registered = registry[key]
+            if not registered:
+                cleared.append(key)
+            providers.extend(ProviderSpec.of(provider) for provider in registered)
+        return cls(
+            providers,
+            [import_path(strategy) for strategy in container.strategies],
+            cleared,
+            collect_stats=container._family.metrics is not None,  # noqa: SLF001
+        )
+
+    def build(self) -> Container:
+        """Create a new container from the description."""
+        strategies: list[Callable] = [load(path) for path in self.strategies]
+        container = Container(strategies, collect_stats=self.collect_stats)
+        container.add(
+            *(spec.build() for spec in self.providers),
+            mode=RegisterMode.APPEND,
+        )
+        for key in self.cleared:
+            container.clear(key)
+        return container
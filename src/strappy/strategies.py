@@ -1,14 +1,86 @@
 """Strategies for getting a provider from a container and parameter."""
 
 import inspect
-from collections.abc import Collection, Hashable
-from typing import Annotated, get_args, get_origin
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+from typing import Annotated, Any, TypeVar, get_args, get_origin
 
 from strappy import type_utils
 from strappy.provider import Provider
-from strappy.types import ContainerLike
+from strappy.selection import Selector
+from strappy.types import ContainerLike, T
+
+StrategyT = TypeVar("StrategyT", bound=Callable)
+
+
+class Shapes:
+    """Parameter shapes that a strategy declares it can handle."""
+
+    __slots__ = ("defaults", "metadata", "origins")
+
+    def __init__(
+        self,
+        origins: tuple[Any, ...] = (),
+        metadata: tuple[type, ...] = (),
+        defaults: tuple[type, ...] = (),
+    ) -> None:
+        """Describe shapes by annotation origin, metadata and default types."""
+        self.origins = origins
+        self.metadata = metadata
+        self.defaults = defaults
+
+    def match(
+        self,
+        origin: Any,
+        metadata_types: tuple[type, ...],
+        default_type: type | None,
+    ) -> bool:
+        """Check whether a parameter shape is one of these shapes."""
+        return (
+            origin in self.origins
+            or any(issubclass(t, self.metadata) for t in metadata_types)
+            or (default_type is not None and issubclass(default_type, self.defaults))
+        )
+
+
+def applies_to(
+    *,
+    origins: tuple[Any, ...] = (),
+    metadata: tuple[type, ...] = (),
+    defaults: tuple[type, ...] = (),
+) -> Callable[[StrategyT], StrategyT]:
+    """Declare which parameters a strategy handles so it can be skipped for others.
+
+    A strategy applies to a parameter if the origin of its annotation is one
+    of `origins`, if it is `Annotated` with metadata of one of the `metadata`
+    types, or if it has a default value of one of the `defaults` types.
+    Strategies without a declaration apply to every parameter.
+    """
+
+    def decorator(strategy: StrategyT) -> StrategyT:
+        strategy.applies_to = Shapes(origins, metadata, defaults)  # type: ignore[attr-defined]
+        return strategy
 
+    return decorator
 
+
+def get_shape(param: inspect.Parameter) -> tuple[Any, tuple[type, ...], type | None]:
+    """Get the origin, metadata types and default type of a parameter."""
+    annotation = param.annotation
+    origin = get_origin(annotation)
+    metadata_types = (
+        tuple(type(item) for item in get_args(annotation)[1:])
+        if origin is Annotated
+        else ()
+    )
+    default_type = (
+        None
+        if param.default is inspect._empty  # noqa: SLF001
+        else type(param.default)
+    )
+    return origin, metadata_types, default_type
+
+
+@applies_to(origins=(Annotated,), defaults=(object,))
 def use_depends_meta_if_present(
     param: inspect.Parameter,
     container: ContainerLike,  # noqa: ARG001
@@ -23,19 +95,20 @@ def use_depends_meta_if_present(
     return None
 
 
-def _search_for_subtypes(
+def _find_registered(
     service: type,
-    registry: dict[Hashable, list[Provider]],
-) -> list[Provider] | None:
-    # Looks up registered providers by progressively unwrapping type
+    registry: Mapping[Hashable, list[Provider]],
+) -> tuple[Hashable | None, list[Provider]] | None:
+    # Looks up registered providers by progressively unwrapping type, and
+    # gets the key they were found under, or None for a union of keys
     if service in registry:
-        return registry[service]
+        return service, registry[service]
 
     outer_type = service
     inner_type = type_utils.unwrap_if_annotated_or_optional(outer_type)
     while inner_type != outer_type:
         if inner_type in registry:
-            return registry[inner_type]
+            return inner_type, registry[inner_type]
         outer_type = inner_type
         inner_type = type_utils.unwrap_if_annotated_or_optional(outer_type)
 
@@ -47,21 +120,81 @@ def _search_for_subtypes(
             for provider in registry.get(subtype, [])
         ]
         if registered:
-            return registered
+            return None, registered
     return None
 
 
+def _search_for_subtypes(
+    service: type,
+    registry: Mapping[Hashable, list[Provider]],
+) -> list[Provider] | None:
+    found = _find_registered(service, registry)
+    return found[1] if found is not None else None
+
+
 def search_registry_for_type(
     param: inspect.Parameter,
     container: ContainerLike,
 ) -> Provider | None:
-    """Search registry for parameter type or subtype and return registered provider."""
-    providers = _search_for_subtypes(param.annotation, container.registry)
-    if providers:
-        return providers[0]
-    return None
+    """Search registry for parameter type or subtype and return registered provider.
 
+    If several providers are registered for the type, the first one is used
+    unless a selection policy was configured for the type.
+    """
+    found = _find_registered(param.annotation, container.registry)
+    if not found or not found[1]:
+        return None
+    key, providers = found
+    if len(providers) > 1 and key is not None:
+        policy = container.selection_policy(key)
+        if policy is not None:
+            return Selector(providers, policy, provides=key)
+    return providers[0]
+
+
+class Collector(Provider[T]):
+    """Provider of a collection of the results of several registered providers."""
+
+    def __init__(
+        self,
+        collection_type: type,
+        members: Sequence[Provider],
+        provides: Hashable,
+    ) -> None:
+        """Collect the results of providers into a collection type."""
+        super().__init__(factory=collection_type, provides=provides)  # type: ignore[reportArgumentType]
+        self.members = tuple(members)
+
+    def _build(
+        self,
+        resolver: ContainerLike,
+        args: tuple = (),  # noqa: ARG002
+        kwargs: dict[str, Any] | None = None,
+    ) -> T:
+        collection_type: Callable[[Iterable], T] = self.factory  # type: ignore[assignment]
+        return collection_type(
+            resolver.provide(member, kwargs=kwargs) for member in self.members
+        )
+
+
+class Builder(Provider[T]):
+    """Provider of functions building a type in the container that needs them."""
+
+    def __init__(self, service: Any, provides: Hashable) -> None:
+        """Build functions resolving a service each time they are called."""
+        super().__init__(factory=service, provides=provides)  # type: ignore[reportArgumentType]
+        self.service = service
 
+    def _build(
+        self,
+        resolver: ContainerLike,
+        args: tuple = (),  # noqa: ARG002
+        kwargs: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> T:
+        return resolver.builder(self.service)  # type: ignore[return-value]
+
+
+@applies_to(origins=(list, set, tuple))
 def search_registry_for_collection_inner_type(
     param: inspect.Parameter,
     container: ContainerLike,
@@ -74,13 +207,33 @@ def search_registry_for_collection_inner_type(
     providers = _search_for_subtypes(inner_type, container.registry)
     if providers is None:
         return None
+    return Collector(collection_type, providers, provides=annotation)
 
-    def collection_factory(*args, **kwargs) -> Collection:  # noqa: ANN002, ANN003, ARG001
-        return collection_type(
-            provider.get(container, kwargs=kwargs) for provider in providers
-        )
 
-    return Provider(factory=collection_factory, provides=annotation)
+@applies_to(origins=(Callable,))
+def use_builder_for_callable(
+    param: inspect.Parameter,
+    container: ContainerLike,
+) -> Provider | None:
+    """Get a provider of a function building the return type of `Callable[[], T]`.
+
+    The function builds `T` in the container each time it is called, passing
+    on any keyword arguments it is given, so it can be used to build many
+    instances in a loop. See `Container.builder`. Builders are only provided
+    when the container has a provider for `T`, and never for builtin types
+    or `Any`, so that callbacks are not mistaken for builders.
+    """
+    if param.default is not inspect._empty:  # noqa: SLF001
+        return None
+    args = get_args(param.annotation)
+    if len(args) != 2 or args[0] not in ([], Ellipsis):  # noqa: PLR2004
+        return None
+    service = args[1]
+    if service in (None, Any) or getattr(service, "__module__", None) == "builtins":
+        return None
+    if not container.has_provider(service):
+        return None
+    return Builder(service, provides=param.annotation)
 
 
 def use_type_as_factory(
@@ -1,5 +1,6 @@
 """Utility functions for working with type hints."""
 
+import importlib
 import inspect
 import types
 from typing import Annotated, Any, Protocol, Union, get_args, get_origin
@@ -66,3 +67,19 @@ def is_concrete_class(hint: Any) -> bool:
     except TypeError:
         return False
     return is_class and not (is_abstract or is_protocol)
+
+
+def describe(obj: Any) -> str:
+    """Get a short human readable name for a type hint, callable or other object."""
+    if isinstance(obj, type) or inspect.isroutine(obj):
+        return obj.__qualname__
+    return repr(obj)
+
+
+def load(target: str) -> Any:
+    """Import an object given as `module:attribute`, or `module` alone."""
+    module_name, _, attributes = target.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for attribute in filter(None, attributes.split(".")):
+        obj = getattr(obj, attribute)
+    return obj
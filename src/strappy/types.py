@@ -1,21 +1,54 @@
 """Shared generic types and protocols."""
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Hashable, Mapping, Sequence
 from typing import Any, Protocol, TypeAlias, TypeVar
 
 T = TypeVar("T")
 Factory: TypeAlias = type[T] | Callable[..., T]
 FactoryT = TypeVar("FactoryT", bound=type | Callable)
+CallableT = TypeVar("CallableT", bound=Callable)
 
 
 class ContainerLike(Protocol):
     """Protocol describing an object that can resolve needs for parameters."""
 
     @property
-    def registry(self) -> dict[Hashable, list]:
+    def registry(self) -> Mapping[Hashable, list]:
         """Property for getting dictionary of registered providers."""
         ...
 
+    def resolve(
+        self,
+        service: Any,
+        args: tuple = (),
+        kwargs: dict[str, Any] | None = None,
+    ) -> Any:
+        """Get an instance of a type by recursively resolving dependencies."""
+        ...
+
+    def has_provider(self, service: Any) -> bool:
+        """Check whether a provider would be chosen for a type."""
+        ...
+
+    def builder(self, service: Any) -> Callable[..., Any]:
+        """Get a function building an instance of a type each time it is called."""
+        ...
+
+    def provide(
+        self,
+        provider: Any,
+        kwargs: dict[str, Any] | None = None,
+    ) -> Any:
+        """Get a result from a provider found in the registry."""
+        ...
+
+    def selection_policy(
+        self,
+        key: Hashable,
+    ) -> Callable[[Sequence[Any]], Any] | None:
+        """Get the policy choosing among several providers for a key, if any."""
+        ...
+
     def call(
         self,
         function: Callable[..., T],
@@ -0,0 +1,132 @@
+from collections.abc import Callable
+from typing import Any, Protocol
+from unittest.mock import Mock
+
+import pytest
+
+from strappy import Container, Provider, ResolutionError, Scope
+from strappy import strategies as st
+
+
+class Client: ...
+
+
+class Record:
+    def __init__(self, client: Client, row: int = 0) -> None:
+        self.client = client
+        self.row = row
+
+
+class Processor:
+    def __init__(self, make_record: Callable[[], Record]) -> None:
+        self.make_record = make_record
+
+
+def test_callable_parameters_get_builders():
+    container = Container()
+    container.add(Provider(Client, scope=Scope.SINGLETON))
+
+    processor = container.resolve(Processor)
+    first = processor.make_record()
+    second = processor.make_record()
+
+    assert isinstance(first, Record)
+    assert first is not second
+    assert first.client is second.client
+
+
+def test_builders_pass_keyword_arguments():
+    container = Container()
+
+    def process(make_record: Callable[..., Record]) -> list[int]:
+        return [make_record(row=row).row for row in range(3)]
+
+    assert container.call(process) == [0, 1, 2]
+
+
+def test_builders_follow_registration_changes():
+    container = Container()
+    processor = container.resolve(Processor)
+    client = Client()
+
+    container.add(Provider(instance=client))
+
+    assert processor.make_record().client is client
+
+
+def test_builders_are_not_injected_over_defaults_or_for_none():
+    container = Container()
+
+    def callback(on_done: Callable[[], None]) -> None: ...
+
+    def with_default(make: Callable[[], Record] = Record) -> Callable:
+        return make
+
+    assert container.call(with_default) is Record
+    with pytest.raises(ResolutionError):
+        container.call(callback)
+
+
+def test_registered_callables_take_precedence():
+    container = Container()
+
+    def make_record() -> Record:
+        return Record(Client(), row=7)
+
+    container.add(Provider(instance=make_record, provides=Callable[[], Record]))
+
+    assert container.resolve(Processor).make_record is make_record
+
+
+def test_builders_plan_once_until_registrations_change():
+    container = Container()
+    strategy = Mock(wraps=st.use_type_as_factory, applies_to=None)
+    container.strategies = [st.search_registry_for_type, strategy]
+    make_record = container.builder(Record)
+    make_record()
+    calls = strategy.call_count
+
+    records = [make_record(row=row) for row in range(3)]
+
+    assert strategy.call_count == calls
+    assert [record.row for record in records] == [0, 1, 2]
+
+    client = Client()
+    container.add(Provider(instance=client))
+
+    assert make_record().client is client
+
+
+def test_builders_raise_when_called_without_a_provider():
+    container = Container()
+    container.strategies = [st.search_registry_for_type]
+    make_record = container.builder(Record)
+
+    with pytest.raises(ResolutionError):
+        make_record()
+
+
+class Store(Protocol): ...
+
+
+class MemoryStore: ...
+
+
+def test_builders_are_only_injected_for_types_with_providers():
+    container = Container()
+
+    def with_callback(on_name: Callable[[], str]) -> None: ...
+
+    def with_hook(hook: Callable[..., Any]) -> None: ...
+
+    def with_store(make_store: Callable[[], Store]) -> Store:
+        return make_store()
+
+    for function in (with_callback, with_hook, with_store):
+        with pytest.raises(ResolutionError):
+            container.call(function)
+
+    store = MemoryStore()
+    container.add(Provider(instance=store, provides=Store))
+
+    assert container.call(with_store) is store
@@ -0,0 +1,101 @@
+import inspect
+import threading
+
+from strappy import Container, Provider, RegisterMode
+from strappy.types import ContainerLike
+
+WRITES = 300
+
+
+def _keys(index: int) -> tuple[str, str]:
+    return f"first-{index}", f"second-{index}"
+
+
+def test_readers_never_see_partial_batches():
+    container = Container()
+    child = container.extend()
+    errors = []
+    done = threading.Event()
+
+    def write() -> None:
+        for index in range(WRITES):
+            first, second = _keys(index)
+            container.add(
+                Provider(instance=object(), provides=first),  # type: ignore[arg-type]
+                Provider(instance=object(), provides=second),  # type: ignore[arg-type]
+            )
+        done.set()
+
+    def read() -> None:
+        try:
+            while not done.is_set():
+                registry = child.registry
+                for index in range(WRITES):
+                    first, second = _keys(index)
+                    if first in registry:
+                        assert second in registry
+                len(list(registry.items()))
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    write()
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+    assert len(child.registry) == 2 * WRITES
+
+
+def test_concurrent_appends_are_not_lost():
+    container = Container()
+
+    class Plugin: ...
+
+    def register() -> None:
+        for _ in range(100):
+            container.add(Provider(Plugin), mode=RegisterMode.APPEND)
+
+    threads = [threading.Thread(target=register) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(container.registry[Plugin]) == 400
+    assert len(container.resolve(list[Plugin])) == 400
+
+
+def test_registry_views_are_snapshots():
+    container = Container()
+    plugin = Provider(instance=object(), provides="plugin")  # type: ignore[arg-type]
+    container.add(plugin)
+    registry = container.registry
+
+    container.unset("plugin")
+
+    assert "plugin" in registry
+    assert registry["plugin"] == [plugin]
+    assert "plugin" not in container.registry
+
+
+def test_strategies_see_one_snapshot_while_keys_are_unregistered():
+    class Plugin: ...
+
+    def unregister_between_lookups(
+        param: inspect.Parameter,
+        container: ContainerLike,
+    ) -> Provider | None:
+        registry = container.registry
+        if param.annotation not in registry:
+            return None
+        container.unset(param.annotation)  # type: ignore[attr-defined]
+        return registry[param.annotation][0]
+
+    container = Container([unregister_between_lookups])
+    container.add(Provider(Plugin))
+
+    assert isinstance(container.resolve(Plugin), Plugin)
+    assert Plugin not in container.registry
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from strappy import Container, Provider, Scope
+from strappy.errors import DeadlineExceededError
+
+release = threading.Event()
+
+
+class Remote:
+    def __init__(self) -> None:
+        release.wait(5)
+
+
+class DefaultRemote(Remote):
+    def __init__(self) -> None: ...
+
+
+class Service:
+    def __init__(self, remote: Remote) -> None:
+        self.remote = remote
+
+
+@pytest.fixture(autouse=True)
+def _release_builds():
+    release.clear()
+    yield
+    release.set()
+
+
+def test_provider_timeout_abandons_builds_on_an_executor():
+    container = Container(collect_stats=True)
+    container.add(Provider(Remote, timeout=0.05))
+
+    with ThreadPoolExecutor() as executor:
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError) as info:
+            container.resolve(Service, executor=executor)
+        elapsed = time.monotonic() - start
+        release.set()
+
+    assert elapsed < 2
+    assert info.value.key is Remote
+    assert str(info.value) == (
+        "Deadline exceeded building Remote needed by Service(remote)"
+    )
+    assert container.stats()[Remote].failures == 1
+
+
+def test_fallbacks_are_used_and_not_cached():
+    container = Container()
+    container.add(
+        Provider(
+            Remote,
+            scope=Scope.SINGLETON,
+            timeout=0.05,
+            fallback=Provider(DefaultRemote),
+        ),
+    )
+
+    with ThreadPoolExecutor() as executor:
+        first = container.resolve(Service, executor=executor).remote
+        second = container.resolve(Service, executor=executor).remote
+        release.set()
+
+    assert isinstance(first, DefaultRemote)
+    assert first is not second
+
+
+def test_fallbacks_are_built_after_the_resolution_deadline():
+    container = Container()
+    container.add(Provider(Remote, fallback=Provider(DefaultRemote)))
+
+    with ThreadPoolExecutor() as executor:
+        remote = container.resolve(
+            Remote,
+            executor=executor,
+            deadline=time.monotonic() + 0.05,
+        )
+        release.set()
+
+    assert isinstance(remote, DefaultRemote)
+
+
+def test_expired_deadlines_fail_before_building():
+    container = Container()
+    built = []
+    container.add(Provider(lambda: built.append(1) or Remote(), provides=Remote))
+
+    with pytest.raises(DeadlineExceededError):
+        container.resolve(Service, deadline=time.monotonic() - 1)
+
+    assert not built
+
+
+def test_deadlines_do_not_affect_fast_builds():
+    release.set()
+    container = Container()
+
+    with ThreadPoolExecutor() as executor:
+        service = container.resolve(
+            Service,
+            executor=executor,
+            deadline=time.monotonic() + 5,
+        )
+
+    assert isinstance(service.remote, Remote)
+
+
+def test_nested_timed_builds_do_not_starve_a_single_worker():
+    class Leaf: ...
+
+    class Mid:
+        def __init__(self, leaf: Leaf) -> None:
+            self.leaf = leaf
+
+    class Root:
+        def __init__(self, mid: Mid) -> None:
+            self.mid = mid
+
+    container = Container()
+    for service in (Root, Mid, Leaf):
+        container.add(Provider(service, timeout=2))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        start = time.monotonic()
+        root = container.resolve(Root, executor=executor)
+        elapsed = time.monotonic() - start
+
+    assert isinstance(root.mid.leaf, Leaf)
+    assert elapsed < 1
+
+
+def test_aresolve():
+    container = Container()
+
+    async def resolve_both() -> tuple[Remote, Exception]:
+        release.set()
+        remote = await container.aresolve(Remote)
+        release.clear()
+        try:
+            await container.aresolve(Remote, deadline=time.monotonic() + 0.05)
+        except DeadlineExceededError as exc:
+            return remote, exc
+        finally:
+            release.set()
+        pytest.fail("deadline was not enforced")
+
+    remote, error = asyncio.run(resolve_both())
+
+    assert isinstance(remote, Remote)
+    assert error.key is Remote
+
+
+def test_aresolve_reports_the_path_that_ran_out_of_time():
+    container = Container()
+
+    async def resolve() -> DeadlineExceededError:
+        try:
+            await container.aresolve(Service, deadline=time.monotonic() + 0.05)
+        except DeadlineExceededError as exc:
+            return exc
+        finally:
+            release.set()
+        pytest.fail("deadline was not enforced")
+
+    error = asyncio.run(resolve())
+
+    assert error.key is Remote
+    assert str(error) == "Deadline exceeded building Remote needed by Service(remote)"
@@ -0,0 +1,75 @@
+from typing import Protocol
+
+import pytest
+
+from strappy import Container, Provider, ResolutionError
+
+
+class Client(Protocol): ...
+
+
+class Repository:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+class App:
+    def __init__(self, repository: Repository) -> None:
+        self.repository = repository
+
+
+def test_resolution_error_describes_dependency_path():
+    container = Container()
+
+    with pytest.raises(ResolutionError) as exc_info:
+        container.resolve(App)
+
+    error = exc_info.value
+    assert error.key is Client
+    assert error.path == [(App, "repository"), (Repository, "client")]
+    assert "App(repository) -> Repository(client)" in str(error)
+    assert "search_registry_for_type" in str(error)
+
+
+def test_unregistered_abstract_type_raises_resolution_error():
+    container = Container()
+
+    with pytest.raises(ResolutionError) as exc_info:
+        container.resolve(Client)
+
+    assert exc_info.value.key is Client
+    assert exc_info.value.path == []
+
+
+def test_type_errors_raised_by_factories_are_not_hidden():
+    def broken_factory() -> int:
+        msg = "broken"
+        raise TypeError(msg)
+
+    container = Container()
+    container.add(Provider(broken_factory))
+
+    with pytest.raises(TypeError, match="broken"):
+        container.resolve(int)
+
+
+def test_repeated_misses_do_not_rerun_strategies():
+    calls = []
+
+    def counting_strategy(param, container):
+        calls.append(param.annotation)
+        providers = container.registry.get(param.annotation)
+        return providers[0] if providers else None
+
+    container = Container(strategies=[counting_strategy])
+
+    for _ in range(3):
+        with pytest.raises(ResolutionError):
+            container.resolve(Client)
+
+    assert calls == [Client]
+
+    container.add(Provider[Client](instance=object()))
+    container.resolve(Client)
+
+    assert calls == [Client, Client]
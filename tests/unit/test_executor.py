@@ -0,0 +1,159 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from strappy import Container, Provider, Scope
+
+DELAY = 0.2
+
+
+class SlowA:
+    def __init__(self) -> None:
+        time.sleep(DELAY)
+
+
+class SlowB:
+    def __init__(self) -> None:
+        time.sleep(DELAY)
+
+
+class App:
+    def __init__(self, a: SlowA, b: SlowB) -> None:
+        self.a = a
+        self.b = b
+
+
+def test_independent_dependencies_are_built_concurrently():
+    container = Container()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        start = time.perf_counter()
+        app = container.resolve(App, executor=executor)
+        elapsed = time.perf_counter() - start
+
+    assert isinstance(app.a, SlowA)
+    assert isinstance(app.b, SlowB)
+    assert elapsed < 1.5 * DELAY
+
+
+def test_singletons_are_built_once_across_branches():
+    builds = []
+
+    class Shared:
+        def __init__(self) -> None:
+            builds.append(threading.get_ident())
+            time.sleep(DELAY / 4)
+
+    def left(shared: Shared) -> Shared:
+        return shared
+
+    def right(shared: Shared) -> Shared:
+        return shared
+
+    def root(a: Shared, b: Shared, c: Shared) -> tuple[Shared, Shared, Shared]:
+        return a, b, c
+
+    container = Container()
+    container.add(Provider(Shared, scope=Scope.SINGLETON))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        a, b, c = container.call(root, executor=executor)
+
+    assert len(builds) == 1
+    assert a is b is c
+
+
+def test_nested_branches_do_not_starve_a_single_worker():
+    class Leaf: ...
+
+    class Middle:
+        def __init__(self, x: Leaf, y: Leaf) -> None:
+            self.leaves = (x, y)
+
+    class Top:
+        def __init__(self, x: Middle, y: Middle, z: Middle) -> None:
+            self.middles = (x, y, z)
+
+    container = Container()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        top = container.resolve(Top, executor=executor)
+
+    assert all(isinstance(middle, Middle) for middle in top.middles)
+
+
+def test_resolve_many_builds_roots_concurrently():
+    container = Container()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        start = time.perf_counter()
+        a, b = container.resolve_many([SlowA, SlowB], executor=executor)
+        elapsed = time.perf_counter() - start
+
+    assert isinstance(a, SlowA)
+    assert isinstance(b, SlowB)
+    assert elapsed < 1.5 * DELAY
+
+
+class Connection:
+    def __init__(self) -> None:
+        time.sleep(DELAY / 10)
+        self.thread = threading.get_ident()
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def use_connections(
+    a: Connection, b: Connection, c: Connection
+) -> tuple[Connection, Connection, Connection]:
+    return a, b, c
+
+
+def test_thread_scope_is_kept_for_the_calling_thread():
+    container = Container()
+    container.add(Provider(Connection, scope=Scope.THREAD))
+    seen: dict[int, list[Connection]] = {}
+
+    def work(executor: ThreadPoolExecutor) -> None:
+        used = [*container.call(use_connections, executor=executor)]
+        used.extend(container.call(use_connections, executor=executor))
+        used.append(container.resolve(Connection))
+        seen[threading.get_ident()] = used
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        callers = [threading.Thread(target=work, args=(executor,)) for _ in range(4)]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+
+    assert len(seen) == len(callers)
+    for used in seen.values():
+        assert len({id(connection) for connection in used}) == 1
+    assert len({id(used[0]) for used in seen.values()}) == len(callers)
+
+
+def test_task_scope_is_kept_for_the_calling_task():
+    container = Container()
+    container.add(Provider(Connection, scope=Scope.TASK, cleanup=Connection.close))
+
+    async def use(executor: ThreadPoolExecutor) -> list[Connection]:
+        used = [*container.call(use_connections, executor=executor)]
+        await asyncio.sleep(0)
+        used.append(container.resolve(Connection))
+        return used
+
+    async def main(executor: ThreadPoolExecutor) -> list[list[Connection]]:
+        return await asyncio.gather(use(executor), use(executor))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first, second = asyncio.run(main(executor))
+
+    assert len({id(connection) for connection in first}) == 1
+    assert len({id(connection) for connection in second}) == 1
+    assert first[0] is not second[0]
+    assert first[0].closed
+    assert second[0].closed
@@ -1,6 +1,9 @@
+import inspect
+from collections.abc import Callable
 from unittest.mock import Mock
 
 import strappy
+from strappy import strategies as st
 
 
 def test_child_has_parents_registrations():
@@ -50,3 +53,130 @@ def test_child_registry_overrides_parents():
     # Changes to the parent are propagated
     parent.unset(str)
     assert child.registry == {}
+
+
+def test_deeply_extended_container_sees_ancestor_changes():
+    root = strappy.Container()
+    leaf = root
+    for _ in range(100):
+        leaf = leaf.extend()
+    mock_provider_1 = Mock(provides=str)
+    mock_provider_2 = Mock(provides=str)
+
+    root.add(mock_provider_1)
+    assert leaf.registry[str] == [mock_provider_1]
+
+    root.add(mock_provider_2, mode=strappy.RegisterMode.OVERWRITE)
+    assert leaf.registry[str] == [mock_provider_2]
+
+    root.unset(str)
+    assert str not in leaf.registry
+
+
+def test_child_registry_lists_keys_in_override_order():
+    parent = strappy.Container()
+    child = parent.extend()
+    mock_str_provider = Mock(provides=str)
+    mock_int_provider = Mock(provides=int)
+    mock_child_str_provider = Mock(provides=str)
+
+    parent.add(mock_str_provider, mock_int_provider)
+    child.add(mock_child_str_provider)
+
+    assert list(child.registry) == [str, int]
+    assert len(child.registry) == 2
+    assert child.registry.get(float) is None
+    assert dict(child.registry) == {
+        str: [mock_child_str_provider],
+        int: [mock_int_provider],
+    }
+
+
+class Client: ...
+
+
+class FakeClient(Client): ...
+
+
+class Service:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+def _param(service: type) -> inspect.Parameter:
+    return inspect.Parameter(
+        "_",
+        inspect.Parameter.POSITIONAL_ONLY,
+        annotation=service,
+    )
+
+
+def test_child_changes_keep_parent_and_sibling_lookups_cached():
+    parent = strappy.Container()
+    parent.add(strappy.Provider(Client))
+    sibling = parent.extend()
+    layers = parent._current_layer(), sibling._current_layer()  # noqa: SLF001
+    plan = parent._plan(_param(Service))  # noqa: SLF001
+
+    child = parent.extend()
+    child.add(strappy.Provider(instance=FakeClient(), provides=Client))
+
+    assert (parent._current_layer(), sibling._current_layer()) == layers  # noqa: SLF001
+    assert parent._plan(_param(Service)) is plan  # noqa: SLF001
+
+
+def test_children_reuse_parent_plans_unless_they_shadow_their_keys():
+    parent = strappy.Container()
+    parent.add(strappy.Provider(Client, scope=strappy.Scope.SINGLETON))
+    strategy = Mock(wraps=st.use_type_as_factory, applies_to=None)
+    parent.strategies = [st.search_registry_for_type, strategy]
+    parent.resolve(Service)
+    calls = strategy.call_count
+
+    child = parent.extend()
+    child.add(strappy.Provider(instance=1, provides=int))
+    service = child.resolve(Service)
+
+    assert strategy.call_count == calls
+    assert service.client is parent.resolve(Client)
+
+    fake = FakeClient()
+    child.add(strappy.Provider(instance=fake, provides=Client))
+
+    assert child.resolve(Service).client is fake
+    assert parent.resolve(Service).client is not fake
+
+
+def test_children_see_ancestor_changes_after_reusing_plans():
+    parent = strappy.Container()
+    child = parent.extend()
+    assert type(child.resolve(Service).client) is Client
+
+    fake = FakeClient()
+    parent.add(strappy.Provider(instance=fake, provides=Client))
+
+    assert child.resolve(Service).client is fake
+
+
+class Handler:
+    def __init__(
+        self,
+        services: list[Service],
+        make_service: Callable[[], Service],
+    ) -> None:
+        self.services = services
+        self.make_service = make_service
+
+
+def test_reused_plans_build_collections_and_builders_in_the_child():
+    parent = strappy.Container()
+    parent.add(strappy.Provider(Service))
+    parent.resolve(Handler)
+
+    child = parent.extend()
+    fake = FakeClient()
+    child.add(strappy.Provider(instance=fake, provides=Client))
+    handler = child.resolve(Handler)
+
+    assert handler.services[0].client is fake
+    assert handler.make_service().client is fake
@@ -0,0 +1,62 @@
+from strappy import Container, Provider, Scope
+
+
+class Tenant:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Connection: ...
+
+
+def test_for_key_configures_each_key_once():
+    container = Container()
+    configured = []
+
+    def configure(child: Container) -> None:
+        configured.append(child)
+        child.add(Provider(instance=Tenant(f"tenant-{len(configured)}")))
+
+    first = container.for_key("a", configure=configure)
+    second = container.for_key("a", configure=configure)
+    other = container.for_key("b", configure=configure)
+
+    assert first is second
+    assert other is not first
+    assert configured == [first, other]
+    assert first.resolve(Tenant).name == "tenant-1"
+    assert other.resolve(Tenant).name == "tenant-2"
+    assert first.parent is container
+
+
+def test_for_key_children_keep_their_singletons():
+    container = Container()
+
+    def configure(child: Container) -> None:
+        child.add(Provider(Connection, scope=Scope.SINGLETON))
+
+    connection = container.for_key("a", configure).resolve(Connection)
+
+    assert container.for_key("a", configure).resolve(Connection) is connection
+
+
+def test_least_recently_used_children_are_evicted():
+    evicted = []
+    container = Container()
+    container.configure_key_cache(
+        maxsize=2,
+        on_evict=lambda key, child: evicted.append(key),
+    )
+
+    a = container.for_key("a")
+    container.for_key("b")
+    assert container.for_key("a") is a
+    container.for_key("c")
+
+    assert evicted == ["b"]
+    assert container.for_key("a") is a
+
+    container.evict_key("a")
+
+    assert evicted == ["b", "a"]
+    assert container.for_key("a") is not a
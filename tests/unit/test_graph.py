@@ -0,0 +1,148 @@
+import json
+from dataclasses import make_dataclass
+from typing import Protocol
+from unittest.mock import Mock
+
+from strappy import Container, Provider, RegisterMode, Scope, introspection
+from strappy.cli import main
+from strappy.graph import build_graph
+
+
+class Database: ...
+
+
+class Handler: ...
+
+
+class Missing(Protocol): ...
+
+
+class Repository:
+    def __init__(self, database: Database, handlers: list[Handler]) -> None:
+        self.database = database
+        self.handlers = handlers
+
+
+class App:
+    def __init__(self, repository: Repository, database: Database) -> None:
+        self.repository = repository
+        self.database = database
+
+
+class Broken:
+    def __init__(self, missing: Missing) -> None:
+        self.missing = missing
+
+
+container = Container()
+container.add(Provider(Database, scope=Scope.SINGLETON))
+container.add(Provider(Handler), Provider(Handler), mode=RegisterMode.APPEND)
+
+
+def test_graph_describes_providers_and_dependencies():
+    graph = build_graph(container, [App])
+
+    nodes = {node.key: node for node in graph.nodes}
+    assert nodes[Database].scope == "SINGLETON"
+    assert nodes[Database].strategy == "search_registry_for_type"
+    assert nodes[App].strategy == "use_type_as_factory"
+    assert graph.roots == [nodes[App]]
+    edges = {(source.key, target.key, param) for source, target, param in graph.edges}
+    assert (App, Repository, "repository") in edges
+    assert (App, Database, "database") in edges
+    assert (Repository, Database, "database") in edges
+    assert (Repository, list[Handler], "handlers") in edges
+    assert len([node for node in graph.nodes if node.key is Handler]) == 2
+
+
+def test_graph_marks_unresolved_dependencies():
+    graph = build_graph(container, [Broken])
+
+    missing = next(node for node in graph.nodes if node.key is Missing)
+    assert not missing.resolved
+
+
+def test_timed_graph_records_builds():
+    graph = build_graph(container, [App], timed=True)
+
+    nodes = {node.key: node for node in graph.nodes}
+    assert nodes[App].instances_created == 1
+    assert nodes[Repository].build_seconds is not None
+    assert nodes[Repository].build_seconds >= 0
+
+
+def test_cli_prints_dot_graph(capsys):
+    assert main(["graph", f"{__name__}:container", f"{__name__}:App"]) == 0
+
+    out = capsys.readouterr().out
+    assert out.startswith("digraph strappy {")
+    assert 'label="repository"' in out
+
+
+def test_cli_writes_json_graph(tmp_path):
+    output = tmp_path / "graph.json"
+    argv = [
+        "graph",
+        f"{__name__}:container",
+        f"{__name__}:App",
+        "--format=json",
+        "--timed",
+        f"--output={output}",
+    ]
+
+    assert main(argv) == 0
+
+    data = json.loads(output.read_text())
+    assert data["roots"] == ["n0"]
+    assert data["nodes"][0]["key"] == "App"
+    assert data["nodes"][0]["instances_created"] == 1
+    assert {"source": "n0", "target": "n1", "param": "repository"} in data["edges"]
+
+
+def test_graph_introspects_without_caches(monkeypatch):
+    container.resolve(App)
+    read = Mock(wraps=introspection._from_signature)  # noqa: SLF001
+    monkeypatch.setattr(introspection, "_from_signature", read)
+
+    graph = build_graph(container, [App])
+
+    read.assert_any_call(App)
+    read.assert_any_call(Repository)
+    assert all(
+        node.introspection_seconds > 0
+        for node in graph.nodes
+        if node.key is not Handler
+    )
+
+
+def test_timed_graph_marks_already_built_singletons():
+    fresh = Container()
+    fresh.add(Provider(Database, scope=Scope.SINGLETON))
+    fresh.add(Provider(Handler))
+    fresh.resolve(Database)
+
+    graph = build_graph(fresh, [App], timed=True)
+
+    nodes = {node.key: node for node in graph.nodes}
+    assert nodes[Database].cached
+    assert nodes[Database].instances_created == 0
+    assert not nodes[App].cached
+    assert nodes[App].instances_created == 1
+    assert "cached" in graph.to_dot()
+
+
+def test_graph_keeps_nodes_of_many_unregistered_dependencies_apart():
+    services = [type(f"Dependency{index}", (), {}) for index in range(200)]
+    root = make_dataclass(
+        "Root",
+        [(f"dependency{index}", service) for index, service in enumerate(services)],
+    )
+
+    graph = build_graph(Container(), [root])
+
+    assert len(graph.nodes) == len(services) + 1
+    assert {
+        (source.key, target.key, param) for source, target, param in graph.edges
+    } == {
+        (root, service, f"dependency{index}") for index, service in enumerate(services)
+    }
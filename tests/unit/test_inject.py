@@ -0,0 +1,122 @@
+import asyncio
+from typing import Protocol
+
+import pytest
+
+from strappy import Container, Provider, RegisterMode, ResolutionError
+
+
+class Database:
+    def __init__(self, name: str = "main") -> None:
+        self.name = name
+
+
+class Request: ...
+
+
+class Cache(Protocol): ...
+
+
+def test_inject_resolves_omitted_arguments():
+    container = Container()
+
+    @container.inject
+    def handler(request: Request, database: Database, limit: int = 10) -> tuple:
+        return request, database, limit
+
+    request = Request()
+    got_request, database, limit = handler(request)
+
+    assert got_request is request
+    assert isinstance(database, Database)
+    assert limit == 10
+    assert handler.__name__ == "handler"
+
+
+def test_inject_does_not_resolve_passed_arguments():
+    container = Container()
+    resolved = []
+
+    @container.register
+    def make_database() -> Database:
+        resolved.append(True)
+        return Database()
+
+    @container.inject
+    def handler(database: Database, *, request: Request) -> Database:
+        assert isinstance(request, Request)
+        return database
+
+    database = Database("given")
+    assert handler(database) is database
+    assert handler(database=database) is database
+    assert not resolved
+
+
+def test_inject_positional_only_and_keyword_only():
+    container = Container()
+    container.add(Provider[int](instance=1))
+    container.add(Provider[str](instance="two"))
+
+    @container.inject
+    def handler(a: int, /, b: str, *, c: Request) -> tuple:
+        return a, b, c
+
+    request = Request()
+    assert handler()[:2] == (1, "two")
+    assert handler(5, c=request) == (5, "two", request)
+
+
+def test_inject_follows_registration_changes():
+    container = Container()
+    container.add(Provider(instance=Database("first")))
+
+    @container.inject
+    def handler(database: Database) -> str:
+        return database.name
+
+    assert handler() == "first"
+    container.add(Provider(instance=Database("second")), mode=RegisterMode.OVERWRITE)
+    assert handler() == "second"
+    with container.override({Database: Database("override")}):
+        assert handler() == "override"
+    assert handler() == "second"
+
+
+def test_inject_async_function():
+    container = Container()
+
+    @container.inject
+    async def handler(request: Request, database: Database) -> tuple:
+        await asyncio.sleep(0)
+        return request, database
+
+    request, database = asyncio.run(handler())
+    assert isinstance(request, Request)
+    assert isinstance(database, Database)
+
+
+def test_inject_reports_missing_arguments():
+    container = Container()
+
+    @container.inject
+    def handler(cache: Cache) -> Cache:
+        return cache
+
+    with pytest.raises(ResolutionError, match=r"needed by .*handler\(cache\)"):
+        handler()
+
+
+def test_inject_keeps_positional_only_arguments_in_their_slots():
+    container = Container()
+    container.add(Provider(Request))
+    no_cache = object()
+
+    @container.inject
+    def handler(cache: Cache = no_cache, request: Request = None, /) -> tuple:  # type: ignore[assignment]
+        return cache, request
+
+    cache, request = handler()
+
+    assert cache is no_cache
+    assert isinstance(request, Request)
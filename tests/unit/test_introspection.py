@@ -0,0 +1,127 @@
+import inspect
+from dataclasses import InitVar, dataclass, field
+
+import pytest
+from pydantic import AliasChoices, BaseModel, Field
+
+from strappy import Container, Provider
+from strappy.introspection import DefaultFactory, get_params
+
+
+class Client: ...
+
+
+@dataclass
+class Settings:
+    client: Client
+    name: str = "default"
+    tags: list = field(default_factory=list)
+    secret: str = field(default="", init=False)
+    debug: bool = field(default=False, kw_only=True)
+
+
+class Model(BaseModel):
+    client_name: str = Field(alias="clientName")
+    retries: int = 3
+    tags: list = Field(default_factory=list)
+
+
+def describe(params):
+    return [(p.name, p.kind, p.annotation, p.default) for p in params.values()]
+
+
+def test_dataclass_params_match_signature():
+    params = get_params(Settings)
+    expected = inspect.signature(Settings).parameters
+
+    assert list(params) == list(expected)
+    assert params["tags"].default == DefaultFactory(list)
+    assert [p.kind for p in params.values()] == [p.kind for p in expected.values()]
+    assert params["client"].annotation is Client
+    assert params["name"].default == "default"
+    assert get_params(Settings) is params
+
+
+def test_dataclass_fields_are_resolved_and_defaults_kept():
+    container = Container()
+    container.add(Provider(instance="registered", provides=str))
+
+    settings = container.resolve(Settings)
+
+    assert isinstance(settings.client, Client)
+    assert settings.name == "registered"
+    assert settings.tags == []
+    assert settings.tags is not container.resolve(Settings).tags
+
+
+def test_dataclasses_with_custom_init_or_init_vars_use_signatures():
+    @dataclass
+    class WithInit:
+        client: Client
+
+        def __init__(self, other: Client) -> None:
+            self.client = other
+
+    @dataclass
+    class WithInitVar:
+        client: Client
+        seed: InitVar[int] = 0
+
+        def __post_init__(self, seed: int) -> None:
+            self.seed_used = seed
+
+    assert list(get_params(WithInit)) == ["other"]
+    assert list(get_params(WithInitVar)) == ["client", "seed"]
+
+
+def test_pydantic_params_use_aliases_and_defaults():
+    params = get_params(Model)
+
+    assert describe(params) == [
+        ("clientName", inspect.Parameter.KEYWORD_ONLY, str, inspect.Parameter.empty),
+        ("retries", inspect.Parameter.KEYWORD_ONLY, int, 3),
+        ("tags", inspect.Parameter.KEYWORD_ONLY, list, DefaultFactory(list)),
+    ]
+
+    container = Container()
+    container.add(Provider(instance="client", provides=str))
+    model = container.resolve(Model)
+    assert model.client_name == "client"
+    assert model.retries == 3
+
+
+def test_pydantic_params_use_validation_aliases():
+    class Aliased(BaseModel, arbitrary_types_allowed=True):
+        client: Client = Field(validation_alias="the_client")
+
+    class Chosen(BaseModel, arbitrary_types_allowed=True):
+        client: Client = Field(validation_alias=AliasChoices("client", "other"))
+
+    class ByName(BaseModel, arbitrary_types_allowed=True, populate_by_name=True):
+        client: Client = Field(alias="the_client")
+
+    assert list(get_params(Aliased)) == ["the_client"]
+    assert list(get_params(Chosen)) == list(inspect.signature(Chosen).parameters)
+    assert list(get_params(ByName)) == list(inspect.signature(ByName).parameters)
+
+    container = Container()
+    for model in (Aliased, Chosen, ByName):
+        assert isinstance(container.resolve(model).client, Client)
+
+
+def test_attrs_params():
+    attrs = pytest.importorskip("attrs")
+
+    @attrs.define
+    class Service:
+        client: Client
+        _name: str = "service"
+        tags: list = attrs.field(factory=list)
+
+    params = get_params(Service)
+
+    assert list(params) == ["client", "name", "tags"]
+    assert params["client"].annotation is Client
+    assert params["name"].default == "service"
+    assert params["tags"].default == DefaultFactory(list)
+    assert isinstance(Container().resolve(Service).client, Client)
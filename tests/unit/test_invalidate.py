@@ -0,0 +1,124 @@
+from strappy import Container, Provider, RegisterMode, Scope
+from strappy.selection import RoundRobin
+
+
+class Config:
+    def __init__(self, name: str = "default") -> None:
+        self.name = name
+
+
+class Pool:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Service:
+    def __init__(self, pool: Pool) -> None:
+        self.pool = pool
+
+
+class Clock: ...
+
+
+def make_container() -> Container:
+    container = Container()
+    container.add(
+        Provider(Config, scope=Scope.SINGLETON),
+        Provider(Pool, scope=Scope.SINGLETON),
+        Provider(Service, scope=Scope.SINGLETON),
+        Provider(Clock, scope=Scope.SINGLETON),
+    )
+    return container
+
+
+def test_invalidate_rebuilds_key_and_transitive_dependents_only():
+    container = make_container()
+    service = container.resolve(Service)
+    clock = container.resolve(Clock)
+
+    container.invalidate(Config)
+    rebuilt = container.resolve(Service)
+
+    assert rebuilt is not service
+    assert rebuilt.pool is not service.pool
+    assert rebuilt.pool.config is not service.pool.config
+    assert container.resolve(Clock) is clock
+
+
+def test_invalidate_dependency_keeps_its_own_dependencies():
+    container = make_container()
+    service = container.resolve(Service)
+
+    container.invalidate(Pool)
+    rebuilt = container.resolve(Service)
+
+    assert rebuilt is not service
+    assert rebuilt.pool is not service.pool
+    assert rebuilt.pool.config is service.pool.config
+
+
+def test_singletons_are_built_by_their_owning_container():
+    parent = make_container()
+    child = parent.extend()
+    sibling = parent.extend()
+    child.add(Provider(instance=Config("child")))
+
+    assert child.resolve(Config).name == "child"
+    assert child.resolve(Service).pool.config.name == "default"
+    assert sibling.resolve(Service) is child.resolve(Service)
+
+
+def test_child_singletons_use_child_registrations():
+    parent = Container()
+    parent.add(Provider(Config, scope=Scope.SINGLETON))
+    child = parent.extend()
+    child.add(Provider(instance=Config("child")))
+    child.add(Provider(Pool, scope=Scope.SINGLETON))
+
+    assert child.resolve(Pool).config.name == "child"
+
+
+def test_singletons_in_collections_are_built_by_their_owning_container():
+    parent = make_container()
+    child = parent.extend()
+    child.add(Provider(instance=Config("child")))
+
+    assert child.resolve(list[Pool])[0].config.name == "default"
+    assert parent.resolve(Pool).config.name == "default"
+
+
+def test_selected_singletons_are_built_by_their_owning_container():
+    parent = Container()
+    parent.add(Provider(Config, scope=Scope.SINGLETON))
+    parent.add(
+        Provider(Pool, scope=Scope.SINGLETON),
+        Provider(Pool, scope=Scope.SINGLETON),
+        mode=RegisterMode.APPEND,
+    )
+    parent.configure_selection(Pool, RoundRobin())
+    child = parent.extend()
+    child.add(Provider(instance=Config("child")))
+
+    assert child.resolve(Pool).config.name == "default"
+    assert child.resolve(Pool).config.name == "default"
+    assert parent.resolve(Pool).config.name == "default"
+
+
+def test_invalidate_rebuilds_singletons_reached_through_collections():
+    container = make_container()
+    pool = container.resolve(list[Pool])[0]
+
+    container.invalidate(Config)
+
+    assert container.resolve(list[Pool])[0] is not pool
+
+
+def test_invalidate_rebuilds_selected_singletons():
+    container = make_container()
+    container.add(Provider(Pool, scope=Scope.SINGLETON), mode=RegisterMode.APPEND)
+    container.configure_selection(Pool, RoundRobin())
+    pools = {container.resolve(Pool), container.resolve(Pool)}
+
+    container.invalidate(Config)
+
+    assert not pools & {container.resolve(Pool), container.resolve(Pool)}
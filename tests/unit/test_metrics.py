@@ -0,0 +1,76 @@
+from typing import Protocol
+
+import pytest
+
+from strappy import Container, Provider, ResolutionError, Scope
+from strappy.metrics import render_prometheus
+
+
+class Config: ...
+
+
+class Handler:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Missing(Protocol): ...
+
+
+def test_stats_count_builds_hits_and_misses():
+    container = Container(collect_stats=True)
+    container.add(Provider(Config, scope=Scope.SINGLETON), Provider(Handler))
+
+    for _ in range(3):
+        container.resolve(Handler)
+
+    stats = container.stats()
+    assert stats[Handler].instances_created == 3
+    assert stats[Handler].cache_hits == 0
+    assert stats[Config].instances_created == 1
+    assert stats[Config].cache_misses == 1
+    assert stats[Config].cache_hits == 2
+    assert sum(stats[Handler].bucket_counts) == 3
+    assert stats[Handler].build_seconds >= 0
+
+
+def test_stats_count_failures():
+    container = Container(collect_stats=True)
+
+    with pytest.raises(ResolutionError):
+        container.resolve(Missing)
+
+    assert container.stats()[Missing].failures == 1
+
+
+def test_stats_aggregate_across_extended_containers():
+    parent = Container(collect_stats=True)
+    parent.add(Provider(Config))
+    child_1 = parent.extend()
+    child_2 = parent.extend()
+
+    child_1.resolve(Config)
+    child_2.resolve(Config)
+
+    assert parent.stats()[Config].instances_created == 2
+
+
+def test_stats_are_empty_unless_enabled():
+    container = Container()
+    container.resolve(Config)
+
+    assert container.stats() == {}
+
+
+def test_render_prometheus():
+    container = Container(collect_stats=True)
+    container.resolve(Config)
+
+    text = render_prometheus(container.stats())
+
+    label = f'key="{Config.__module__}.Config"'
+    assert "# TYPE strappy_instances_created_total counter" in text
+    assert f"strappy_instances_created_total{{{label}}} 1" in text
+    assert f'strappy_build_seconds_bucket{{{label},le="+Inf"}} 1' in text
+    assert f"strappy_build_seconds_count{{{label}}} 1" in text
+    assert text.endswith("\n")
@@ -0,0 +1,142 @@
+from strappy import Container, Provider, Scope
+
+
+class Client: ...
+
+
+class FakeClient(Client): ...
+
+
+class Repository:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+class Clock: ...
+
+
+def test_override_replaces_registration_and_restores_on_exit():
+    container = Container()
+    container.add(Provider(Client))
+    fake = FakeClient()
+
+    with container.override({Client: fake}):
+        assert container.resolve(Client) is fake
+
+    assert type(container.resolve(Client)) is Client
+
+
+def test_override_unregistered_key_is_removed_on_exit():
+    container = Container()
+    fake = FakeClient()
+
+    with container.override({Client: Provider[Client](instance=fake)}):
+        assert container.registry[Client][0].instance is fake
+
+    assert Client not in container.registry
+
+
+def test_override_invalidates_only_dependent_singletons():
+    container = Container()
+    container.add(
+        Provider(Client),
+        Provider(Repository, scope=Scope.SINGLETON),
+        Provider(Clock, scope=Scope.SINGLETON),
+    )
+    repository = container.resolve(Repository)
+    clock = container.resolve(Clock)
+    fake = FakeClient()
+
+    with container.override({Client: fake}):
+        overridden = container.resolve(Repository)
+        assert overridden is not repository
+        assert overridden.client is fake
+        assert container.resolve(Clock) is clock
+
+    assert container.resolve(Repository) is repository
+    assert container.resolve(Clock) is clock
+
+
+def test_singletons_first_built_during_override_are_dropped_on_exit():
+    container = Container()
+    container.add(Provider(Repository, scope=Scope.SINGLETON))
+    fake = FakeClient()
+
+    with container.override({Client: fake}):
+        assert container.resolve(Repository).client is fake
+
+    assert type(container.resolve(Repository).client) is Client
+
+
+def test_override_on_parent_applies_to_children():
+    parent = Container()
+    child = parent.extend()
+    parent.register(Client)
+    assert type(child.resolve(Repository).client) is Client
+    fake = FakeClient()
+
+    with parent.override({Client: fake}):
+        assert child.resolve(Repository).client is fake
+
+    assert type(child.resolve(Repository).client) is Client
+
+
+def test_override_keeps_unrelated_plans_cached():
+    calls = []
+
+    def counting_strategy(param, container):
+        calls.append(param.annotation)
+        providers = container.registry.get(param.annotation)
+        return providers[0] if providers else None
+
+    container = Container(strategies=[counting_strategy])
+    container.add(Provider(Client), Provider(Clock))
+    container.resolve(Clock)
+    container.resolve(Client)
+
+    with container.override({Client: FakeClient()}):
+        container.resolve(Clock)
+        container.resolve(Client)
+
+    container.resolve(Clock)
+
+    assert calls == [Clock, Client, Client]
+
+
+def test_override_invalidates_singletons_reached_through_collections():
+    container = Container()
+    container.add(Provider(Client), Provider(Repository, scope=Scope.SINGLETON))
+    repository = container.resolve(list[Repository])[0]
+    fake = FakeClient()
+
+    with container.override({Client: fake}):
+        assert container.resolve(list[Repository])[0].client is fake
+
+    assert container.resolve(list[Repository])[0] is repository
+
+
+def test_override_leaves_the_registry_uncopied():
+    container = Container()
+    container.add(Provider(Client), Provider(Clock))
+    registry = container._registry  # noqa: SLF001
+
+    with container.override({Client: FakeClient()}):
+        assert container._registry is registry  # noqa: SLF001
+        assert type(container.resolve(Client)) is FakeClient
+
+    assert container._registry is registry  # noqa: SLF001
+    assert type(container.resolve(Client)) is Client
+
+
+def test_override_drops_registrations_for_overridden_keys_made_within():
+    container = Container()
+    container.add(Provider(Client))
+    fake = FakeClient()
+
+    with container.override({Client: fake}):
+        container.unset(Client)
+        container.add(Provider(Clock))
+        assert container.resolve(Client) is fake
+
+    assert type(container.resolve(Client)) is Client
+    assert Clock in container.registry
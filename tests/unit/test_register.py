@@ -1,10 +1,11 @@
+from functools import partial, wraps
 from typing import Protocol
 from unittest.mock import Mock
 
 import pytest
 
 from strappy import Container, Provider, RegisterMode, Scope
-from strappy.errors import RegistrationConflictError
+from strappy.errors import NoProviderTypeError, RegistrationConflictError
 
 
 def test_add_provider_once():
@@ -93,3 +94,91 @@ def test_registering_with_args_calls_add_provider_with_args():
     assert provider.scope is Scope.SINGLETON
     assert provider.instance is None
     assert container.add.call_args.kwargs["mode"] == RegisterMode.OVERWRITE
+
+
+def test_add_many_publishes_one_batch():
+    container = Container()
+    first, second, third = Mock(provides=str), Mock(provides=int), Mock(provides=str)
+    generation = container._family.generation  # noqa: SLF001
+
+    container.add_many(iter([first, second, third]), mode=RegisterMode.APPEND)
+
+    assert container.registry == {str: [first, third], int: [second]}
+    assert container._family.generation == generation + 1  # noqa: SLF001
+
+
+def test_add_many_conflicts_within_a_batch_add_nothing():
+    container = Container()
+
+    with pytest.raises(RegistrationConflictError):
+        container.add_many([Mock(provides=int), Mock(provides=str), Mock(provides=str)])
+
+    assert container.registry == {}
+
+
+def test_add_many_with_overwrite_mode_keeps_the_last_provider():
+    container = Container()
+    container.add(Mock(provides=str))
+    last = Mock(provides=str)
+
+    container.add_many([Mock(provides=str), last], mode=RegisterMode.OVERWRITE)
+
+    assert container.registry == {str: [last]}
+
+
+def test_add_many_does_not_mutate_published_lists():
+    container = Container()
+    first = Mock(provides=str)
+    container.add(first)
+    published = container.registry[str]
+
+    container.add_many([Mock(provides=str)], mode=RegisterMode.APPEND)
+
+    assert published == [first]
+
+
+def test_batch_registers_factories_when_the_block_exits():
+    container = Container()
+
+    with container.batch() as batch:
+
+        @batch.register
+        class Service: ...
+
+        @batch.register(scope=Scope.SINGLETON)
+        def get_name() -> str:
+            return "name"
+
+        assert container.registry == {}
+
+    assert container.resolve(str) == "name"
+    assert isinstance(container.resolve(Service), Service)
+
+
+def test_batch_adds_nothing_if_the_block_raises():
+    container = Container()
+
+    def register_then_fail() -> None:
+        with container.batch() as batch:
+            batch.add(Provider(instance="name"))
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        register_then_fail()
+
+    assert container.registry == {}
+
+
+def test_provides_is_read_from_return_annotations():
+    def get_name() -> str: ...
+
+    @wraps(get_name)
+    def wrapper() -> int: ...
+
+    def unannotated(): ...
+
+    assert Provider(get_name).provides is str
+    assert Provider(wrapper).provides is str
+    assert Provider(partial(get_name)).provides is str
+    with pytest.raises(NoProviderTypeError):
+        Provider(unannotated)
@@ -1,4 +1,13 @@
-from strappy import Container, Scope
+import asyncio
+import gc
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from strappy import Container, Provider, Scope
+from strappy.errors import WeakReferenceError
 
 
 def test_transient_returns_new_result():
@@ -23,3 +32,164 @@ def test_singleton_returns_same_result():
     service_2 = container.resolve(Service)
 
     assert id(service_1) == id(service_2)
+
+
+class Helper: ...
+
+
+class ServiceA:
+    def __init__(self, helper: Helper) -> None:
+        self.helper = helper
+
+
+class ServiceB:
+    def __init__(self, helper: Helper, a: ServiceA) -> None:
+        self.helper = helper
+        self.a = a
+
+
+def test_resolution_scope_is_shared_within_one_resolve():
+    container = Container()
+    container.register(scope=Scope.RESOLUTION)(Helper)
+
+    service = container.resolve(ServiceB)
+
+    assert service.helper is service.a.helper
+
+
+def test_resolution_scope_is_rebuilt_for_each_resolve():
+    container = Container()
+    container.register(scope=Scope.RESOLUTION)(Helper)
+
+    service_1 = container.resolve(ServiceA)
+    service_2 = container.resolve(ServiceA)
+
+    assert service_1.helper is not service_2.helper
+
+
+def test_resolve_many_shares_resolution_scope():
+    container = Container()
+    container.register(scope=Scope.RESOLUTION)(Helper)
+
+    a, b = container.resolve_many([ServiceA, ServiceB])
+
+    assert isinstance(a, ServiceA)
+    assert isinstance(b, ServiceB)
+    assert a.helper is b.helper is b.a.helper
+    assert a is not b.a
+
+
+def test_weak_singleton_is_shared_while_referenced():
+    container = Container()
+    container.add(Provider(Helper, scope=Scope.WEAK_SINGLETON))
+
+    helper = container.resolve(Helper)
+
+    assert container.resolve(Helper) is helper
+    assert container.resolve(ServiceA).helper is helper
+
+
+def test_weak_singleton_is_rebuilt_once_unreferenced():
+    container = Container(collect_stats=True)
+    container.add(Provider(Helper, scope=Scope.WEAK_SINGLETON))
+
+    helper = container.resolve(Helper)
+    reference = weakref.ref(helper)
+    del helper
+    gc.collect()
+
+    assert reference() is None
+    assert isinstance(container.resolve(Helper), Helper)
+    assert container.stats()[Helper].instances_created == 2
+
+
+def test_weak_singleton_requires_weak_references():
+    container = Container()
+    container.add(Provider(dict, provides=dict, scope=Scope.WEAK_SINGLETON))
+
+    with pytest.raises(WeakReferenceError):
+        container.resolve(dict)
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_thread_scope_is_shared_within_a_thread():
+    container = Container()
+    container.add(Provider(Connection, scope=Scope.THREAD))
+
+    main = container.resolve(Connection)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        others = list(executor.map(lambda _: container.resolve(Connection), range(8)))
+
+    assert container.resolve(Connection) is main
+    assert main not in others
+    assert 1 <= len({id(other) for other in others}) <= 2
+
+
+def test_thread_scope_cleans_up_when_the_thread_ends():
+    container = Container()
+    container.add(
+        Provider(Connection, scope=Scope.THREAD, cleanup=Connection.close),
+    )
+    built = []
+
+    thread = threading.Thread(
+        target=lambda: built.append(container.resolve(Connection))
+    )
+    thread.start()
+    thread.join()
+    del thread
+    gc.collect()
+
+    assert built[0].closed
+    assert not container.resolve(Connection).closed
+
+
+def test_task_scope_is_shared_within_a_task():
+    container = Container()
+    container.add(Provider(Connection, scope=Scope.TASK, cleanup=Connection.close))
+
+    async def use() -> tuple[Connection, Connection]:
+        first = container.resolve(Connection)
+        await asyncio.sleep(0)
+        return first, container.resolve(Connection)
+
+    async def main() -> list[tuple[Connection, Connection]]:
+        return await asyncio.gather(use(), use())
+
+    (a1, a2), (b1, b2) = asyncio.run(main())
+
+    assert a1 is a2
+    assert b1 is b2
+    assert a1 is not b1
+    assert a1.closed
+    assert b1.closed
+
+
+def test_task_scope_is_kept_for_the_task_awaiting_aresolve():
+    container = Container()
+    container.add(Provider(Connection, scope=Scope.TASK, cleanup=Connection.close))
+
+    async def use() -> list[Connection]:
+        first = await container.aresolve(Connection)
+        await asyncio.sleep(0)
+        return [
+            first,
+            await container.aresolve(Connection),
+            container.resolve(Connection),
+        ]
+
+    async def main() -> list[list[Connection]]:
+        return await asyncio.gather(*(use() for _ in range(4)))
+
+    used = asyncio.run(main())
+
+    assert all(len({id(connection) for connection in task}) == 1 for task in used)
+    assert len({id(task[0]) for task in used}) == len(used)
+    assert all(task[0].closed for task in used)
@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from strappy import Container, Provider, RegisterMode
+from strappy.graph import build_graph
+from strappy.selection import LeastInFlight, Random, RoundRobin
+
+
+class Client:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Handler:
+    def __init__(self, client: Client, other: Client) -> None:
+        self.client = client
+        self.other = other
+
+
+def make_container() -> Container:
+    container = Container()
+    container.add(
+        *(Provider(instance=Client(name)) for name in ("a", "b", "c")),
+        mode=RegisterMode.APPEND,
+    )
+    return container
+
+
+def test_first_registration_is_used_without_a_policy():
+    container = make_container()
+    assert {container.resolve(Client).name for _ in range(5)} == {"a"}
+
+
+def test_round_robin():
+    container = make_container()
+    container.configure_selection(Client, RoundRobin())
+
+    names = [container.resolve(Client).name for _ in range(6)]
+
+    assert names == ["a", "b", "c", "a", "b", "c"]
+    assert len(container.resolve(list[Client])) == 3
+
+
+def test_random_with_weights():
+    container = make_container()
+    container.configure_selection(Client, Random(weights=[0, 1, 0], seed=1))
+
+    assert {container.resolve(Client).name for _ in range(10)} == {"b"}
+
+
+def test_custom_selector_and_removing_policies():
+    container = make_container()
+    child = container.extend()
+    container.configure_selection(Client, lambda providers: providers[-1])
+
+    assert child.resolve(Client).name == "c"
+    child.configure_selection(Client, None)
+    assert child.resolve(Client).name == "a"
+    assert container.resolve(Client).name == "c"
+
+
+def test_least_in_flight_spreads_one_resolution_and_releases_after():
+    container = make_container()
+    policy = LeastInFlight()
+    container.configure_selection(Client, policy)
+
+    handler = container.resolve(Handler)
+
+    assert handler.client.name == "a"
+    assert handler.other.name == "b"
+    providers = container.registry[Client]
+    assert [policy.in_flight(provider) for provider in providers] == [0, 0, 0]
+    names = Counter(container.resolve(Client).name for _ in range(300))
+    assert names == {"a": 100, "b": 100, "c": 100}
+
+
+def test_least_in_flight_counts_leased_clients_until_the_lease_ends():
+    container = make_container()
+    policy = LeastInFlight()
+    container.configure_selection(Client, policy)
+    providers = container.registry[Client]
+
+    with policy.lease():
+        first = container.resolve(Client)
+        with policy.lease():
+            second = container.resolve(Client)
+            assert [policy.in_flight(provider) for provider in providers] == [1, 1, 0]
+        assert [policy.in_flight(provider) for provider in providers] == [1, 0, 0]
+        third = container.resolve(Client)
+
+    assert (first.name, second.name, third.name) == ("a", "b", "c")
+    assert [policy.in_flight(provider) for provider in providers] == [0, 0, 0]
+
+
+def test_least_in_flight_spreads_concurrent_leases():
+    container = make_container()
+    policy = LeastInFlight()
+    container.configure_selection(Client, policy)
+    busy: Counter[str] = Counter()
+    peaks: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def handle_request(_: int) -> str:
+        with policy.lease():
+            name = container.resolve(Client).name
+            with lock:
+                busy[name] += 1
+                peaks[name] = max(peaks[name], busy[name])
+            time.sleep(0.001)
+            with lock:
+                busy[name] -= 1
+        return name
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        names = Counter(executor.map(handle_request, range(600)))
+
+    assert set(names) == {"a", "b", "c"}
+    assert all(150 <= count <= 250 for count in names.values())
+    assert max(peaks.values()) <= 3
+
+
+def test_graph_shows_choices():
+    container = make_container()
+    container.configure_selection(Client, RoundRobin())
+
+    graph = build_graph(container, [Client])
+
+    assert [param for _, _, param in graph.edges] == [
+        "choice 0",
+        "choice 1",
+        "choice 2",
+    ]
@@ -0,0 +1,106 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from strappy import Container, Provider, RegisterMode, Scope
+from strappy import strategies as st
+from strappy.errors import NotImportableError
+from strappy.spec import ContainerSpec, import_path
+from strappy.types import T
+
+
+class Config:
+    def __init__(self, name: str = "default") -> None:
+        self.name = name
+
+
+class Plugin: ...
+
+
+class Service:
+    def __init__(self, config: Config, plugins: list[Plugin]) -> None:
+        self.config = config
+        self.plugins = plugins
+
+
+def make_plugin() -> Plugin:
+    return Plugin()
+
+
+def make_container() -> Container:
+    container = Container()
+    container.add(Provider(Config, kwargs={"name": "spec"}, scope=Scope.SINGLETON))
+    container.add(
+        Provider(Plugin),
+        Provider(make_plugin),
+        mode=RegisterMode.APPEND,
+    )
+    container.add(Provider[int](instance=42))
+    return container
+
+
+def round_trip(obj: T) -> T:
+    return pickle.loads(pickle.dumps(obj))  # noqa: S301
+
+
+def describe_service(spec: ContainerSpec) -> tuple[str, int, int]:
+    container = spec.build()
+    service = container.resolve(Service)
+    return service.config.name, len(service.plugins), container.resolve(int)
+
+
+def test_spec_round_trips_through_pickle():
+    spec = round_trip(ContainerSpec.of(make_container()))
+    assert describe_service(spec) == ("spec", 2, 42)
+
+
+def test_spec_rebuilds_scopes_strategies_and_clears():
+    parent = make_container()
+    parent.resolve(Config)
+    child = parent.extend()
+    child.clear(Plugin)
+    child.strategies = (st.search_registry_for_type, st.use_type_as_factory)
+
+    container = round_trip(ContainerSpec.of(child)).build()
+
+    assert container.strategies == [
+        st.search_registry_for_type,
+        st.use_type_as_factory,
+    ]
+    assert container.registry[Plugin] == []
+    config = container.resolve(Config)
+    assert config is container.resolve(Config)
+    assert config is not parent.resolve(Config)
+
+
+def test_spec_rejects_unimportable_factories():
+    container = Container()
+    container.add(Provider(lambda: Plugin(), provides=Plugin))  # noqa: PLW0108
+    with pytest.raises(NotImportableError):
+        ContainerSpec.of(container)
+
+
+def test_import_path():
+    assert import_path(Service) == f"{__name__}:Service"
+    with pytest.raises(NotImportableError):
+        import_path(make_container().resolve(Config))
+
+
+def test_providers_pickle_without_cached_results():
+    provider = Provider[Config](Config, scope=Scope.SINGLETON)
+    provider.get(Container())
+
+    copied = round_trip(provider)
+
+    assert type(copied) is Provider
+    assert copied.provides is Config
+    assert copied._result is None  # noqa: SLF001
+    assert copied.get(Container()) is copied.get(Container())
+
+
+def test_workers_bootstrap_from_spec():
+    spec = ContainerSpec.of(make_container())
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(describe_service, [spec, spec]))
+    assert results == [("spec", 2, 42)] * 2
@@ -0,0 +1,70 @@
+from typing import Annotated
+
+from strappy import Container, Provider
+from strappy import strategies as st
+
+
+class Marker:
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+
+def test_strategy_only_called_for_declared_metadata():
+    calls = []
+
+    @st.applies_to(metadata=(Marker,))
+    def use_marker(param, container):
+        calls.append(param.name)
+        marker = param.annotation.__metadata__[0]
+        return Provider[str](instance=marker.value)
+
+    def build(a: Annotated[str, Marker("apple")], b: int = 0) -> tuple[str, int]:
+        return a, b
+
+    container = Container(strategies=[use_marker, *Container().strategies])
+
+    assert container.call(build) == ("apple", 0)
+    assert calls == ["a"]
+
+
+def test_strategy_only_called_for_declared_origins_and_defaults():
+    calls = []
+
+    @st.applies_to(origins=(dict,), defaults=(Marker,))
+    def use_dict_or_marker(param, container):
+        calls.append(param.name)
+
+    def use_name(param, container):
+        return Provider[str](instance=param.name)
+
+    def build(a: dict[str, int], b: Marker = Marker("x"), c: str = "c") -> None:
+        pass
+
+    container = Container(strategies=[use_dict_or_marker, use_name])
+    container.call(build)
+
+    assert calls == ["a", "b"]
+
+
+def test_undeclared_strategies_apply_to_every_parameter():
+    calls = []
+
+    def use_anything(param, container):
+        calls.append(param.name)
+
+    def build(a: int = 1, b: list[int] | None = None) -> None:
+        pass
+
+    Container(strategies=[use_anything]).call(build)
+
+    assert calls == ["a", "b"]
+
+
+def test_replacing_strategies_rebuilds_dispatch_table():
+    container = Container()
+    container.add(Provider[int](instance=1))
+    assert container.resolve(int) == 1
+
+    container.strategies = [lambda param, container: Provider[int](instance=2)]
+
+    assert container.resolve(int) == 2